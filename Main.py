@@ -1,7 +1,12 @@
-from ui import AddRideDisplay
-from domain.RideList import RideList
+import os
+
+from persistence.RideSummary import RideSummary, SUMMARY_NAME
+from ui.WelcomeDisplay import print_welcome_screen
+
+DATA_DIRECTORY = "data"
+RIDES_DIRECTORY = os.path.join(DATA_DIRECTORY, "rides")
 
 def main():
-    pass
+    print_welcome_screen(RideSummary.load(os.path.join(RIDES_DIRECTORY, SUMMARY_NAME)))
 
-main()
\ No newline at end of file
+main()
@@ -0,0 +1,114 @@
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from datetime import time as day_time
+
+from domain.Ride import Ride
+from persistence.PartitionedRideStore import PartitionedRideStore, PARTITION_PREFIX, PARTITION_SUFFIX
+from persistence.RideJournal import RideJournal
+
+REPO_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(REPO_DIRECTORY, "Main.py")
+NUM_RIDES = 50_000
+NUM_YEARS = 20
+NUM_RUNS = 5
+MAX_STARTUP_MS = 100.0
+LAZY_MODULES = ["persistence.PartitionedRideStore", "persistence.LazyRideList", "ui.AddRideDisplay",
+                "logic.FleetPoller", "transit.VehicleFeed", "concurrent.futures", "urllib.request"]
+
+def main():
+    """
+    Measures how long Main.py takes to show the welcome screen on top of a large synthetic history, net of
+    the interpreter's own startup time, and checks that no heavy subsystem is imported to do so. Exits with
+    a non-zero status if either check fails.
+    """
+    with tempfile.TemporaryDirectory() as work_directory:
+        _generate_history(os.path.join(work_directory, "data", "rides"))
+
+        baseline_ms: float = _best_run_ms([sys.executable, "-c", "pass"], work_directory)
+        main_ms: float = _best_run_ms([sys.executable, MAIN_PATH], work_directory)
+        loaded: list[str] = _find_loaded_lazy_modules(work_directory)
+
+    startup_ms: float = main_ms - baseline_ms
+    print(f"Welcome screen over {NUM_RIDES} rides: {startup_ms:.1f} ms "
+          f"(interpreter {baseline_ms:.1f} ms, limit {MAX_STARTUP_MS:.0f} ms)")
+
+    if loaded:
+        print(f"Modules that should be imported lazily were loaded: {', '.join(loaded)}")
+
+    if startup_ms > MAX_STARTUP_MS or loaded:
+        sys.exit(1)
+
+def _generate_history(directory: str) -> None:
+    """
+    Writes `NUM_RIDES` random rides spread over the last `NUM_YEARS` years into a partitioned ride store,
+    then opens the store once so it builds its manifest and summary.
+
+    :param directory: the directory of the store.
+    """
+    os.makedirs(directory)
+
+    rng = random.Random(0)
+    first_day: date = date(date.today().year - NUM_YEARS + 1, 1, 1)
+    days: int = (date.today() - first_day).days + 1
+    journals: dict[int, RideJournal] = {}
+
+    for i in range(NUM_RIDES):
+        ride_date: date = first_day + timedelta(days=rng.randrange(days))
+        key: int = ride_date.year
+
+        if key not in journals:
+            journals[key] = RideJournal(os.path.join(directory, f"{PARTITION_PREFIX}{key}{PARTITION_SUFFIX}"))
+
+        journals[key].append(Ride(
+            ride_date=ride_date,
+            boarding_time=day_time(rng.randrange(24), rng.randrange(60)),
+            route=str(rng.randrange(1, 100)),
+            tracking_number=str(rng.randrange(100, 1000)),
+            destination="Downtown",
+            block_number=f"{rng.randrange(1, 1000)}-{rng.randrange(1, 10)}",
+            notes=""
+        ))
+
+    PartitionedRideStore(directory)
+
+def _best_run_ms(command: list[str], cwd: str) -> float:
+    """
+    Runs a command several times and returns its fastest wall-clock time.
+
+    :param command: the command to run.
+    :param cwd: the directory in which to run the command.
+    :return: the fastest of `NUM_RUNS` runs, in milliseconds.
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_DIRECTORY)
+    best: float = float("inf")
+
+    for _ in range(NUM_RUNS):
+        start: float = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, (time.perf_counter() - start) * 1000)
+
+    return best
+
+def _find_loaded_lazy_modules(cwd: str) -> list[str]:
+    """
+    Runs Main.py and lists the modules in `LAZY_MODULES` that were imported.
+
+    :param cwd: the directory in which to run Main.py.
+    :return: the names of the lazily imported modules that were loaded anyway.
+    """
+    script: str = (f"import runpy, sys; runpy.run_path({MAIN_PATH!r}); "
+                   f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules), file=sys.stderr)")
+    env = dict(os.environ, PYTHONPATH=REPO_DIRECTORY)
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=cwd, env=env, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    return result.stderr.split()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from datetime import date, time
+
+from domain.Ride import Ride
+from domain.RideList import RideList
+from utilities.ReadWriteLock import ReadWriteLock
+from utilities.InvariantHelper import require_not_none
+
+class ConcurrentRideList(RideList):
+    """
+    Represents a ride list that can be read and modified from several threads at once. Queries share a
+    read lock; modifications take an exclusive write lock. Iterating yields a snapshot of the rides taken
+    when iteration starts.
+    """
+    def __init__(self):
+        """
+        Creates a new instance of ConcurrentRideList with an empty list of rides.
+        """
+        self._lock = ReadWriteLock()
+
+        super().__init__()
+
+    def __iter__(self):
+        with self._lock.read_lock():
+            return iter(list(self._rides))
+
+    def add_ride(self, ride: Ride) -> None:
+        with self._lock.write_lock():
+            super().add_ride(ride)
+
+    def try_add_ride(self, ride: Ride) -> bool:
+        """
+        Adds a given ride to this ride list unless a ride with the same date/time already exists, as a
+        single atomic step.
+
+        :param ride: the ride to add to this ride list.
+        :return: True if the ride was added; False if a ride with the same date/time already existed.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        with self._lock.write_lock():
+            if self.get_ride(ride.ride_date, ride.boarding_time) is not None:
+                return False
+
+            super().add_ride(ride)
+
+            return True
+
+    def add_rides(self, rides) -> None:
+        rides = list(rides)
+
+        with self._lock.write_lock():
+            super().add_rides(rides)
+
+    def get_ride(self, ride_date: date, boarding_time: time):
+        with self._lock.read_lock():
+            return super().get_ride(ride_date, boarding_time)
+
+    def get_rides_on_bus(self, tracking_number: str) -> list[Ride]:
+        with self._lock.read_lock():
+            return super().get_rides_on_bus(tracking_number)
+
+    def get_rides_between(self, start: date, end: date) -> list[Ride]:
+        with self._lock.read_lock():
+            return super().get_rides_between(start, end)
+
+    def remove_ride(self, ride_date: date, boarding_time: time) -> None:
+        with self._lock.write_lock():
+            super().remove_ride(ride_date, boarding_time)
+
+    def try_remove_ride(self, ride_date: date, boarding_time: time) -> Ride | None:
+        """
+        Removes the ride with a given date and boarding time from this ride list, as a single atomic step.
+
+        :param ride_date: the date of the ride to remove.
+        :param boarding_time: the boarding time of the ride to remove.
+        :return: the removed ride, or `None` if no such ride existed.
+        """
+        with self._lock.write_lock():
+            ride: Ride | None = self.get_ride(ride_date, boarding_time)
+
+            if ride is not None:
+                super().remove_ride(ride_date, boarding_time)
+
+            return ride
@@ -31,6 +31,28 @@ class RideList:
 
         self._check_ride_list()
 
+    def add_rides(self, rides) -> None:
+        """
+        Adds every ride in a given collection to this ride list, skipping any
+        ride with the same date/time as a ride already in the list (or earlier
+        in the collection). Equivalent to calling `add_ride` for each ride, but
+        runs in linear time.
+
+        :param rides: the rides to add to this ride list.
+        """
+        require_not_none(rides, "Rides should not be None.")
+
+        seen: set[tuple[date, time]] = {(curr.ride_date, curr.boarding_time) for curr in self._rides}
+
+        for ride in rides:
+            require_not_none(ride, "Ride should not be None.")
+
+            if (ride.ride_date, ride.boarding_time) not in seen:
+                seen.add((ride.ride_date, ride.boarding_time))
+                self._rides.append(ride)
+
+        self._check_ride_list()
+
     def get_ride(self, ride_date: date, boarding_time: time):
         """
         Retrieves a ride from this ride list with a given date and boarding time.
@@ -65,6 +87,27 @@ class RideList:
 
         return rides_on_bus
 
+    def get_rides_between(self, start: date, end: date) -> list[Ride]:
+        """
+        Retrieves all rides from this ride list that occurred in a given
+        date range.
+
+        :param start: the start of the date range (inclusive).
+        :param end: the end of the date range (inclusive).
+        :return: a list containing all rides that occurred between `start`
+        and `end`.
+        """
+        require_not_none(start, "Start date should not be None.")
+        require_not_none(end, "End date should not be None.")
+
+        rides_between = []
+
+        for curr in self._rides:
+            if start <= curr.ride_date <= end:
+                rides_between.append(curr)
+
+        return rides_between
+
     def remove_ride(self, ride_date: date, boarding_time: time) -> None:
         """
         Removes a ride with a given date and boarding time from this ride list, or takes
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from utilities.InvariantHelper import require_not_none, require_state
+
+class Sighting:
+    """
+    Represents a single observation of a bus at a given moment. Stores the bus's tracking number, the route it
+    was serving (can be blank if it was out of service), and its latitude/longitude.
+    """
+
+    TRACKING_NUMBER_LENGTH = 3
+
+    def __init__(self, seen_at: datetime, tracking_number: str, route: str, latitude: float, longitude: float):
+        """
+        Creates a new instance of Sighting.
+
+        :param seen_at: the date and time at which the bus was observed.
+        :param tracking_number: the 3-digit tracking number of the observed bus.
+        :param route: the route the bus was serving when observed (can be blank).
+        :param latitude: the latitude of the bus when observed.
+        :param longitude: the longitude of the bus when observed.
+        """
+        require_not_none(seen_at, "Sighting time should not be None.")
+        require_not_none(tracking_number, "Tracking number should not be None.")
+        require_not_none(route, "Route should not be None.")
+        require_not_none(latitude, "Latitude should not be None.")
+        require_not_none(longitude, "Longitude should not be None.")
+        require_state(isinstance(seen_at, datetime), "Sighting time should be a datetime object.")
+
+        self.seen_at: datetime = seen_at
+        self.tracking_number: str = tracking_number
+        self.route: str = route
+        self.latitude: float = float(latitude)
+        self.longitude: float = float(longitude)
+
+        self._check_sighting()
+
+    def __eq__(self, other) -> bool:
+        """
+        Determines whether `other` is an instance of Sighting of the same bus at the same moment as `self`.
+
+        :param other: the object to check for equality.
+        :return: True if `other` is an instance of Sighting with the same tracking number and time as `self`;
+        False otherwise.
+        """
+        if isinstance(other, Sighting):
+            return self.tracking_number == other.tracking_number and self.seen_at == other.seen_at
+
+        return False
+
+    def _check_sighting(self) -> None:
+        require_not_none(self.seen_at, "Sighting time should not be None.")
+        require_not_none(self.tracking_number, "Tracking number should not be None.")
+        require_state(len(self.tracking_number) == self.TRACKING_NUMBER_LENGTH,
+                      "Tracking number length should be 3.")
+        require_state(self.tracking_number.isdigit(), "Tracking number should only contain digits.")
+        require_not_none(self.route, "Route should not be None.")
+        require_state(-90.0 <= self.latitude <= 90.0, "Latitude should be between -90 and 90.")
+        require_state(-180.0 <= self.longitude <= 180.0, "Longitude should be between -180 and 180.")
@@ -0,0 +1,123 @@
+import random
+import threading
+
+from domain.Sighting import Sighting
+from persistence.SightingStore import SightingStore
+from transit.exceptions.FeedError import FeedError, FeedExhaustedError
+from utilities.InvariantHelper import require_not_none, require_state
+
+DEFAULT_INTERVAL_SECONDS = 30.0
+DEFAULT_JITTER_SECONDS = 5.0
+DEFAULT_MAX_BACKOFF_SECONDS = 600.0
+MAX_BACKOFF_DOUBLINGS = 32
+
+class FleetPoller:
+    """
+    Polls a vehicle-positions feed on a background thread at a fixed interval (plus random jitter) and appends
+    every sighting to a sighting store. Backs off exponentially while the feed or the store is failing, and
+    stops on its own once a replayed feed is exhausted or an unexpected error occurs (see `get_last_error`).
+    """
+    def __init__(self, feed, store: SightingStore, interval: float = DEFAULT_INTERVAL_SECONDS,
+                 jitter: float = DEFAULT_JITTER_SECONDS, max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS):
+        """
+        Creates a new instance of FleetPoller. The poller does nothing until it is started.
+
+        :param feed: the feed to poll (any object with a `fetch()` method returning a list of sightings).
+        :param store: the store to append sightings to.
+        :param interval: the number of seconds between two successful polls.
+        :param jitter: the maximal number of seconds randomly added to or removed from each wait.
+        :param max_backoff: the maximal number of seconds to wait between two failed polls.
+        """
+        require_not_none(feed, "Feed should not be None.")
+        require_not_none(store, "Store should not be None.")
+        require_state(interval > 0, "Interval should be positive.")
+        require_state(0 <= jitter <= interval, "Jitter should be between 0 and the interval.")
+        require_state(max_backoff >= interval, "Maximal backoff should be at least the interval.")
+
+        self._feed = feed
+        self._store: SightingStore = store
+        self._interval: float = interval
+        self._jitter: float = jitter
+        self._max_backoff: float = max_backoff
+        self._failures: int = 0
+        self._last_error: Exception | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Starts polling on a daemon thread, or takes no action if the poller is already running.
+        """
+        if self.is_running():
+            return
+
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="fleet-poller",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops polling and waits for the current poll (if any) to finish. If the wait times out, the polling
+        thread still stops after its current poll, and the poller can be started again right away.
+
+        :param timeout: the maximal number of seconds to wait for the polling thread, or `None` to wait
+        indefinitely.
+        """
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_last_error(self) -> Exception | None:
+        """
+        Retrieves the error raised by the most recent failed poll, which may have stopped the poller.
+
+        :return: the last error raised while polling, or `None` if the last poll succeeded.
+        """
+        return self._last_error
+
+    def poll_once(self) -> int:
+        """
+        Fetches one snapshot from the feed and appends it to the store. Raises any FeedError raised by
+        the feed and any OSError raised by the store.
+
+        :return: the number of sightings appended.
+        """
+        sightings: list[Sighting] = self._feed.fetch()
+        self._store.append(sightings)
+
+        return len(sightings)
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                self.poll_once()
+                self._failures = 0
+                self._last_error = None
+            except FeedExhaustedError:
+                break
+            except (FeedError, OSError) as e:
+                self._failures += 1
+                self._last_error = e
+            except Exception as e:
+                self._last_error = e
+                break
+
+            stop_event.wait(self._next_delay())
+
+    def _next_delay(self) -> float:
+        """
+        Computes the number of seconds to wait before the next poll: the interval with jitter after a
+        success, or an exponentially growing delay (capped at the maximal backoff) after failures.
+
+        :return: the number of seconds to wait.
+        """
+        if self._failures > 0:
+            return min(self._interval * 2 ** min(self._failures, MAX_BACKOFF_DOUBLINGS), self._max_backoff)
+
+        return max(0.0, self._interval + random.uniform(-self._jitter, self._jitter))
@@ -1,6 +1,8 @@
+from collections.abc import Iterable
 from enum import Enum
 from datetime import date, time
 
+from domain.Ride import Ride
 from domain.RideList import RideList
 from logic.exceptions.RideManagerError import DateRangeError, RideFilterError
 from utilities.InvariantHelper import require_not_none
@@ -23,7 +25,7 @@ def filter_by_date(ride_list: RideList, start: date, end: date) -> RideList:
     if start > end:
         raise DateRangeError()
 
-    return _filter_ride_list(ride_list,
+    return _filter_ride_list(ride_list.get_rides_between(start, end),
                              lambda r: start <= r.ride_date <= end)
 
 def filter_by_time(ride_list: RideList, start: time, end: time) -> RideList:
@@ -78,7 +80,7 @@ def filter_by_tracking_number(ride_list: RideList, tracking_number: str) -> Ride
     require_not_none(ride_list, "Ride list should not be None.")
     require_not_none(tracking_number, "Tracking number should not be None.")
 
-    return _filter_ride_list(ride_list,
+    return _filter_ride_list(ride_list.get_rides_on_bus(tracking_number.strip()),
                              lambda r: r.tracking_number.strip() == tracking_number.strip())
 
 def filter_by_block_number(ride_list: RideList, block_number: str) -> RideList:
@@ -113,12 +115,13 @@ def filter_by_destination(ride_list: RideList, destination: str) -> RideList:
     return _filter_ride_list(ride_list,
                                  lambda r: r.destination.casefold().strip() == destination.casefold().strip())
 
-def _filter_ride_list(ride_list: RideList, filterer) -> RideList:
+def _filter_ride_list(ride_list: Iterable[Ride], filterer) -> RideList:
     """
     Creates a new ride list containing only the rides in `ride_list`
     that satisfy a given boolean function.
 
-    :param ride_list: the ride list to filter (not mutated).
+    :param ride_list: the ride list (or any other collection of rides)
+    to filter (not mutated).
     :param filterer: the boolean function that determines whether
     a given ride (the only parameter) should be included in the result.
     :return: a ride list containing all rides in `ride_list` for which
@@ -148,7 +151,7 @@ class RideFilter(Enum):
     @classmethod
     def from_string(cls, raw: str) -> "RideFilter":
         for curr in cls:
-            if curr.value().casefold().strip() == raw.casefold().strip():
+            if curr.value.casefold().strip() == raw.casefold().strip():
                 return curr
 
         raise RideFilterError()
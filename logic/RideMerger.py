@@ -0,0 +1,156 @@
+import csv
+import heapq
+import itertools
+import os
+from collections.abc import Iterable, Iterator
+from enum import Enum
+
+from domain.Ride import Ride
+from logic.exceptions.RideMergerError import UnsortedSourceError, ConflictPolicyError
+from persistence.RideJournal import ride_to_row
+from utilities.InvariantHelper import require_not_none
+
+TMP_SUFFIX = ".tmp"
+
+class ConflictPolicy(Enum):
+    """
+    Represents different ways of resolving rides with the same date and
+    boarding time but different details in several ride histories. REPORT
+    keeps the first ride like FIRST_WINS; it is meant for callers that
+    present the recorded conflicts for review.
+    """
+    FIRST_WINS = "first_wins"
+    NEWEST_NOTES_WINS = "newest_notes_wins"
+    REPORT = "report"
+
+    @classmethod
+    def from_string(cls, raw: str) -> "ConflictPolicy":
+        for curr in cls:
+            if curr.value.casefold().strip() == raw.casefold().strip():
+                return curr
+
+        raise ConflictPolicyError()
+
+def merge_rides(sources: list[Iterable[Ride]], policy=ConflictPolicy.FIRST_WINS,
+                conflicts: list[list[Ride]] | None = None) -> Iterator[Ride]:
+    """
+    Merges several ride histories, each sorted by date and boarding time,
+    into a single sorted history. Sources are read lazily and only one
+    ride per source is held in memory at a time. Rides with the same date
+    and boarding time are resolved with `policy`. Raises an
+    UnsortedSourceError if a source is out of order.
+
+    :param sources: the ride histories to merge, ordered from oldest to
+    newest.
+    :param policy: a ConflictPolicy, or a function taking the conflicting
+    rides (in source order) and returning the ride to keep (or `None` to
+    drop them all).
+    :param conflicts: a list to which every group of conflicting rides
+    (in source order) is appended, or `None` to not record conflicts.
+    :return: an iterator over the merged rides, earliest first.
+    """
+    require_not_none(sources, "Sources should not be None.")
+    require_not_none(policy, "Conflict policy should not be None.")
+
+    resolver = _get_resolver(policy)
+    tagged = [_tag_source(source, i) for i, source in enumerate(sources)]
+    merged = heapq.merge(*tagged, key=lambda item: (item[1].ride_date, item[1].boarding_time, item[0]))
+
+    for _, group in itertools.groupby(merged, key=lambda item: (item[1].ride_date, item[1].boarding_time)):
+        rides: list[Ride] = [ride for _, ride in group]
+
+        if all(ride_to_row(curr) == ride_to_row(rides[0]) for curr in rides):
+            yield rides[0]
+            continue
+
+        if conflicts is not None:
+            conflicts.append(rides)
+
+        resolved: Ride | None = resolver(rides)
+        if resolved is not None:
+            yield resolved
+
+def merge_ride_files(sources: list[Iterable[Ride]], output_path: str,
+                     policy=ConflictPolicy.FIRST_WINS) -> list[list[Ride]]:
+    """
+    Merges several sorted ride histories (see `merge_rides`) and writes
+    the result to a ride file in RideJournal format, one ride at a time.
+    The result is written to a temporary file that replaces `output_path`
+    only once the merge succeeds, so the output may also be one of the
+    sources.
+
+    :param sources: the ride histories to merge, ordered from oldest to
+    newest.
+    :param output_path: the path of the ride file to write (overwritten).
+    :param policy: the policy used to resolve conflicting rides.
+    :return: every group of conflicting rides found while merging.
+    """
+    require_not_none(output_path, "Output path should not be None.")
+
+    conflicts: list[list[Ride]] = []
+    tmp_path: str = output_path + TMP_SUFFIX
+
+    try:
+        with open(tmp_path, "w", newline="", encoding="utf-8") as output:
+            writer = csv.writer(output)
+
+            for ride in merge_rides(sources, policy, conflicts):
+                writer.writerow(ride_to_row(ride))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, output_path)
+
+    return conflicts
+
+def _get_resolver(policy):
+    """
+    Retrieves the function that resolves conflicting rides for a given
+    policy.
+
+    :param policy: a ConflictPolicy, or a custom resolving function.
+    :return: a function taking the conflicting rides (in source order)
+    and returning the ride to keep, or `None` to drop them all.
+    """
+    if policy in (ConflictPolicy.FIRST_WINS, ConflictPolicy.REPORT):
+        return lambda rides: rides[0]
+    elif policy == ConflictPolicy.NEWEST_NOTES_WINS:
+        return _resolve_newest_notes
+    elif callable(policy):
+        return policy
+
+    raise ConflictPolicyError()
+
+def _resolve_newest_notes(rides: list[Ride]) -> Ride:
+    """
+    Keeps the ride from the newest source that has non-blank notes, or
+    the ride from the first source if none has notes.
+
+    :param rides: the conflicting rides, in source order.
+    :return: the ride to keep.
+    """
+    for curr in reversed(rides):
+        if curr.notes.strip():
+            return curr
+
+    return rides[0]
+
+def _tag_source(source: Iterable[Ride], index: int) -> Iterator[tuple[int, Ride]]:
+    """
+    Pairs every ride of a source with the index of that source, checking
+    that the source is sorted by date and boarding time.
+
+    :param source: the ride history to tag.
+    :param index: the position of `source` in the list of sources.
+    :return: an iterator over (index, ride) pairs.
+    """
+    prev: Ride | None = None
+
+    for ride in source:
+        if prev is not None and (ride.ride_date, ride.boarding_time) < (prev.ride_date, prev.boarding_time):
+            raise UnsortedSourceError()
+
+        prev = ride
+        yield index, ride
@@ -0,0 +1,78 @@
+import heapq
+from collections import Counter
+from collections.abc import Iterable
+
+from domain.Ride import Ride
+from utilities.InvariantHelper import require_not_none, require_state
+
+def count_unique_vehicles(rides: Iterable[Ride]) -> int:
+    """
+    Counts the number of distinct buses ridden in a collection of rides.
+
+    :param rides: the rides to count.
+    :return: the number of distinct tracking numbers in `rides`.
+    """
+    require_not_none(rides, "Rides should not be None.")
+
+    return len({curr.tracking_number for curr in rides})
+
+def count_rides_per_vehicle(rides: Iterable[Ride]) -> dict[str, int]:
+    """
+    Counts the number of rides on each bus in a collection of rides.
+
+    :param rides: the rides to count.
+    :return: a dictionary mapping each tracking number to its number of rides.
+    """
+    require_not_none(rides, "Rides should not be None.")
+
+    return dict(Counter(curr.tracking_number for curr in rides))
+
+def count_rides_per_route(rides: Iterable[Ride]) -> dict[str, int]:
+    """
+    Counts the number of rides on each route in a collection of rides. Routes
+    are compared case-insensitively.
+
+    :param rides: the rides to count.
+    :return: a dictionary mapping each route (upper case) to its number of rides.
+    """
+    require_not_none(rides, "Rides should not be None.")
+
+    return dict(Counter(curr.route.strip().upper() for curr in rides))
+
+def count_rides_per_block(rides: Iterable[Ride]) -> dict[str, int]:
+    """
+    Counts the number of rides on each block in a collection of rides.
+
+    :param rides: the rides to count.
+    :return: a dictionary mapping each block number to its number of rides.
+    """
+    require_not_none(rides, "Rides should not be None.")
+
+    return dict(Counter(curr.block_number.strip() for curr in rides))
+
+def get_most_frequent_vehicles(rides_per_vehicle: dict[str, int], count: int) -> list[tuple[str, int]]:
+    """
+    Retrieves the most frequently ridden buses, breaking ties by tracking number.
+
+    :param rides_per_vehicle: a dictionary mapping each tracking number to its
+    number of rides (see `count_rides_per_vehicle`).
+    :param count: the maximal number of buses to retrieve.
+    :return: a list of (tracking number, number of rides) pairs, most ridden first.
+    """
+    require_not_none(rides_per_vehicle, "Rides per vehicle should not be None.")
+    require_state(count >= 0, "Count should not be negative.")
+
+    return heapq.nsmallest(count, rides_per_vehicle.items(), key=lambda item: (-item[1], item[0]))
+
+def get_most_recent_rides(rides: Iterable[Ride], count: int) -> list[Ride]:
+    """
+    Retrieves the most recent rides in a collection of rides.
+
+    :param rides: the rides from which to retrieve the most recent ones.
+    :param count: the maximal number of rides to retrieve.
+    :return: a list containing the `count` most recent rides, most recent first.
+    """
+    require_not_none(rides, "Rides should not be None.")
+    require_state(count >= 0, "Count should not be negative.")
+
+    return heapq.nlargest(count, rides, key=lambda r: (r.ride_date, r.boarding_time))
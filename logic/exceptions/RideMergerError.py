@@ -0,0 +1,11 @@
+class RideMergerError(Exception):
+    """
+    Exception thrown when ride histories cannot be merged.
+    """
+    pass
+
+class UnsortedSourceError(RideMergerError):
+    pass
+
+class ConflictPolicyError(RideMergerError):
+    pass
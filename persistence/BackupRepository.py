@@ -0,0 +1,275 @@
+import csv
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from domain.Ride import Ride
+from domain.RideList import RideList
+from persistence.PartitionedRideStore import PARTITION_PREFIX, PARTITION_SUFFIX
+from persistence.RideJournal import ride_from_row
+from persistence.exceptions.BackupError import (SnapshotNotFoundError, MissingFileError, CorruptBackupError,
+                                                     RepositoryNotFoundError)
+from utilities.InvariantHelper import require_not_none
+
+CHUNKS_DIRECTORY = "chunks"
+SNAPSHOTS_DIRECTORY = "snapshots"
+SNAPSHOT_SUFFIX = ".json"
+SNAPSHOT_ID_FORMAT = "%Y%m%dT%H%M%S%f"
+CHUNK_SIZE = 64 * 1024
+VERIFY_WORKERS = 4
+TMP_SUFFIX = ".tmp"
+
+class BackupRepository:
+    """
+    Stores incremental, deduplicated backups of a ride store directory. Each file is split into fixed-size
+    chunks stored once under the SHA-256 hash of their contents, so a backup only writes the chunks that
+    changed since any earlier backup (for append-only partitions, usually just the last chunk of the current
+    year). Each backup is recorded as a snapshot listing the chunks of every file, and any snapshot can be
+    restored.
+    """
+    def __init__(self, directory: str, create: bool = True):
+        """
+        Creates a new instance of BackupRepository. Creates `directory` if it does not exist and `create` is
+        True; otherwise raises a RepositoryNotFoundError if `directory` is not a backup repository.
+
+        :param directory: the directory in which to store chunks and snapshots.
+        :param create: whether to create the repository if it does not exist (False for read-only use).
+        """
+        require_not_none(directory, "Directory should not be None.")
+
+        self._directory: str = directory
+
+        if create:
+            os.makedirs(self._chunks_directory(), exist_ok=True)
+            os.makedirs(self._snapshots_directory(), exist_ok=True)
+        elif not os.path.isdir(self._snapshots_directory()):
+            raise RepositoryNotFoundError()
+
+    def create_backup(self, source_directory: str) -> str:
+        """
+        Backs up every file in a given directory. Files whose size and modification time are unchanged since
+        the latest snapshot are not read again; other files are chunked and only new chunks are written.
+
+        :param source_directory: the directory to back up (typically a PartitionedRideStore directory).
+        :return: the ID of the new snapshot.
+        """
+        require_not_none(source_directory, "Source directory should not be None.")
+
+        snapshot_ids: list[str] = self.list_snapshots()
+        prev_files: dict = self._read_snapshot(snapshot_ids[-1])["files"] if snapshot_ids else {}
+        files: dict = {}
+
+        for name in sorted(os.listdir(source_directory)):
+            path: str = os.path.join(source_directory, name)
+
+            if not os.path.isfile(path) or name.endswith(TMP_SUFFIX):
+                continue
+
+            stat = os.stat(path)
+            prev: dict | None = prev_files.get(name)
+
+            if prev is not None and prev["size"] == stat.st_size and prev["mtime_ns"] == stat.st_mtime_ns:
+                files[name] = prev
+            else:
+                files[name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                               "chunks": self._write_chunks(path)}
+
+        snapshot_id: str = datetime.now().strftime(SNAPSHOT_ID_FORMAT)
+        self._write_json(self._snapshot_path(snapshot_id), {"created_at": datetime.now().isoformat(),
+                                                            "files": files})
+
+        return snapshot_id
+
+    def list_snapshots(self) -> list[str]:
+        """
+        Retrieves the ID of every snapshot in this repository, oldest first.
+
+        :return: a sorted list of snapshot IDs.
+        """
+        return sorted(name.removesuffix(SNAPSHOT_SUFFIX) for name in os.listdir(self._snapshots_directory())
+                      if name.endswith(SNAPSHOT_SUFFIX))
+
+    def verify(self, snapshot_id: str | None = None) -> list[str]:
+        """
+        Checks that every chunk referenced by a snapshot (or by all snapshots) exists and still matches its
+        hash. Chunks are checksummed in parallel.
+
+        :param snapshot_id: the ID of the snapshot to verify, or `None` to verify every snapshot.
+        :return: a sorted list of the hashes of all missing or corrupt chunks (empty if the backup is sound).
+        """
+        snapshot_ids: list[str] = self.list_snapshots() if snapshot_id is None else [snapshot_id]
+        hashes: set[str] = set()
+
+        for curr in snapshot_ids:
+            for file in self._read_snapshot(curr)["files"].values():
+                hashes.update(file["chunks"])
+
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            results = executor.map(self._is_chunk_sound, sorted(hashes))
+
+            return [chunk_hash for chunk_hash, sound in zip(sorted(hashes), results) if not sound]
+
+    def read_file(self, snapshot_id: str, name: str) -> bytes:
+        """
+        Reassembles the contents of a file as it was in a given snapshot. Raises a CorruptBackupError if any
+        of its chunks is missing or corrupt.
+
+        :param snapshot_id: the ID of the snapshot.
+        :param name: the name of the file in the backed-up directory.
+        :return: the contents of the file.
+        """
+        require_not_none(name, "File name should not be None.")
+
+        files: dict = self._read_snapshot(snapshot_id)["files"]
+
+        if name not in files:
+            raise MissingFileError()
+
+        return b"".join(self._read_chunk(chunk_hash) for chunk_hash in files[name]["chunks"])
+
+    def restore_files(self, snapshot_id: str, target_directory: str) -> None:
+        """
+        Writes every file of a given snapshot into a directory, replacing files with the same name. Nothing
+        is written unless every file of the snapshot can be read.
+
+        :param snapshot_id: the ID of the snapshot to restore.
+        :param target_directory: the directory into which to restore the files.
+        """
+        require_not_none(target_directory, "Target directory should not be None.")
+
+        contents: dict[str, bytes] = {name: self.read_file(snapshot_id, name)
+                                      for name in self._read_snapshot(snapshot_id)["files"]}
+
+        os.makedirs(target_directory, exist_ok=True)
+
+        for name, content in contents.items():
+            path: str = os.path.join(target_directory, name)
+
+            with open(path + TMP_SUFFIX, "wb") as file:
+                file.write(content)
+
+            os.replace(path + TMP_SUFFIX, path)
+
+    def restore_ride_list(self, snapshot_id: str) -> RideList:
+        """
+        Rebuilds the ride list stored in a given snapshot of a ride store directory.
+
+        :param snapshot_id: the ID of the snapshot to restore.
+        :return: a ride list containing every ride in the snapshot's partitions.
+        """
+        ride_list: RideList = RideList()
+
+        for name in self._get_partition_names(snapshot_id):
+            ride_list.add_rides(self._read_partition(snapshot_id, name))
+
+        return ride_list
+
+    def iter_sorted_rides(self, snapshot_id: str):
+        """
+        Streams every ride in a given snapshot of a ride store directory in (date, boarding time) order.
+        Only one partition is held in memory at a time.
+
+        :param snapshot_id: the ID of the snapshot to read.
+        :return: an iterator over all rides in the snapshot, earliest first.
+        """
+        for name in self._get_partition_names(snapshot_id):
+            yield from sorted(self._read_partition(snapshot_id, name),
+                              key=lambda r: (r.ride_date, r.boarding_time))
+
+    def _get_partition_names(self, snapshot_id: str) -> list[str]:
+        """
+        Retrieves the names of the ride store partitions in a given snapshot, in chronological order.
+
+        :param snapshot_id: the ID of the snapshot.
+        :return: a sorted list of partition file names.
+        """
+        return sorted(name for name in self._read_snapshot(snapshot_id)["files"]
+                      if name.startswith(PARTITION_PREFIX) and name.endswith(PARTITION_SUFFIX))
+
+    def _read_partition(self, snapshot_id: str, name: str) -> list[Ride]:
+        text: str = self.read_file(snapshot_id, name).decode("utf-8")
+
+        return [ride_from_row(row) for row in csv.reader(io.StringIO(text, newline="")) if row]
+
+    def _write_chunks(self, path: str) -> list[str]:
+        """
+        Splits a file into fixed-size chunks and stores every chunk not already in this repository.
+
+        :param path: the path of the file to chunk.
+        :return: the hashes of the file's chunks, in order.
+        """
+        hashes: list[str] = []
+
+        with open(path, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                chunk_hash: str = hashlib.sha256(chunk).hexdigest()
+                chunk_path: str = self._chunk_path(chunk_hash)
+
+                if not os.path.exists(chunk_path):
+                    os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+
+                    with open(chunk_path + TMP_SUFFIX, "wb") as chunk_file:
+                        chunk_file.write(chunk)
+
+                    os.replace(chunk_path + TMP_SUFFIX, chunk_path)
+
+                hashes.append(chunk_hash)
+
+        return hashes
+
+    def _read_chunk(self, chunk_hash: str) -> bytes:
+        """
+        Reads a chunk and checks it against its hash. Raises a CorruptBackupError if the chunk is missing or
+        does not match.
+
+        :param chunk_hash: the hash of the chunk to read.
+        :return: the contents of the chunk.
+        """
+        try:
+            with open(self._chunk_path(chunk_hash), "rb") as chunk_file:
+                chunk: bytes = chunk_file.read()
+        except FileNotFoundError:
+            raise CorruptBackupError()
+
+        if hashlib.sha256(chunk).hexdigest() != chunk_hash:
+            raise CorruptBackupError()
+
+        return chunk
+
+    def _is_chunk_sound(self, chunk_hash: str) -> bool:
+        try:
+            self._read_chunk(chunk_hash)
+            return True
+        except CorruptBackupError:
+            return False
+
+    def _read_snapshot(self, snapshot_id: str) -> dict:
+        require_not_none(snapshot_id, "Snapshot ID should not be None.")
+
+        try:
+            with open(self._snapshot_path(snapshot_id), encoding="utf-8") as snapshot:
+                return json.load(snapshot)
+        except FileNotFoundError:
+            raise SnapshotNotFoundError()
+
+    @staticmethod
+    def _write_json(path: str, content: dict) -> None:
+        with open(path + TMP_SUFFIX, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+
+        os.replace(path + TMP_SUFFIX, path)
+
+    def _chunks_directory(self) -> str:
+        return os.path.join(self._directory, CHUNKS_DIRECTORY)
+
+    def _snapshots_directory(self) -> str:
+        return os.path.join(self._directory, SNAPSHOTS_DIRECTORY)
+
+    def _chunk_path(self, chunk_hash: str) -> str:
+        return os.path.join(self._chunks_directory(), chunk_hash[:2], chunk_hash)
+
+    def _snapshot_path(self, snapshot_id: str) -> str:
+        return os.path.join(self._snapshots_directory(), snapshot_id + SNAPSHOT_SUFFIX)
@@ -0,0 +1,112 @@
+import threading
+from datetime import date, time
+
+from domain.Ride import Ride
+from domain.RideList import RideList
+from persistence.PartitionedRideStore import PartitionedRideStore, partition_key
+from utilities.InvariantHelper import require_not_none, require_state
+
+DEFAULT_HOT_YEARS = 1
+
+class LazyRideList(RideList):
+    """
+    Represents a ride list backed by a partitioned ride store. Only the partitions of the most recent years
+    are loaded on creation; older partitions are loaded the first time a query needs them. Mutations are
+    applied in memory only (persist them through the store). Queries may run concurrently from several
+    threads (as in the add flow's background lookups); each partition is loaded only once.
+    """
+    def __init__(self, store: PartitionedRideStore, hot_years: int = DEFAULT_HOT_YEARS):
+        """
+        Creates a new instance of LazyRideList and loads the partitions of the last `hot_years` years.
+
+        :param store: the store from which to load partitions.
+        :param hot_years: the number of most recent years (including the current one) to load eagerly.
+        """
+        require_not_none(store, "Store should not be None.")
+        require_state(hot_years >= 0, "Number of hot years should not be negative.")
+
+        super().__init__()
+
+        self._store: PartitionedRideStore = store
+        self._loaded: set[int] = set()
+        self._load_lock = threading.Lock()
+
+        first_hot_year: int = date.today().year - hot_years + 1
+        self._load_partitions([key for key in store.get_partition_keys() if key >= first_hot_year])
+
+    def __iter__(self):
+        self._load_partitions(self._store.get_partition_keys())
+
+        return super().__iter__()
+
+    def add_ride(self, ride: Ride) -> None:
+        require_not_none(ride, "Ride should not be None.")
+
+        self._load_partitions([partition_key(ride.ride_date)])
+        super().add_ride(ride)
+
+    def add_rides(self, rides) -> None:
+        require_not_none(rides, "Rides should not be None.")
+
+        rides = list(rides)
+        self._load_partitions(sorted({partition_key(curr.ride_date) for curr in rides}))
+        super().add_rides(rides)
+
+    def get_ride(self, ride_date: date, boarding_time: time):
+        require_not_none(ride_date, "Date should not be None.")
+
+        self._load_partitions([partition_key(ride_date)])
+
+        return super().get_ride(ride_date, boarding_time)
+
+    def get_rides_on_bus(self, tracking_number: str) -> list[Ride]:
+        self._load_partitions(self._store.plan(tracking_number=tracking_number))
+
+        return super().get_rides_on_bus(tracking_number)
+
+    def get_rides_between(self, start: date, end: date) -> list[Ride]:
+        require_not_none(start, "Start date should not be None.")
+        require_not_none(end, "End date should not be None.")
+
+        self._load_partitions(self._store.plan(start=start, end=end))
+
+        return super().get_rides_between(start, end)
+
+    def remove_ride(self, ride_date: date, boarding_time: time) -> None:
+        require_not_none(ride_date, "Date should not be None.")
+
+        self._load_partitions([partition_key(ride_date)])
+        super().remove_ride(ride_date, boarding_time)
+
+    def get_loaded_partitions(self) -> list[int]:
+        """
+        Retrieves the keys (years) of the partitions loaded so far.
+
+        :return: a sorted list of loaded partition keys.
+        """
+        return sorted(self._loaded)
+
+    def _load_partitions(self, keys: list[int]) -> None:
+        """
+        Loads every partition in `keys` that has not been loaded yet. Rides repeated within a partition
+        are ignored, as in RideList.add_ride.
+
+        :param keys: the keys (years) of the partitions to load.
+        """
+        with self._load_lock:
+            for key in keys:
+                if key in self._loaded:
+                    continue
+
+                seen: set[tuple[date, time]] = set()
+                partition: list[Ride] = []
+
+                for curr in self._store.read_partition(key):
+                    if (curr.ride_date, curr.boarding_time) not in seen:
+                        seen.add((curr.ride_date, curr.boarding_time))
+                        partition.append(curr)
+
+                self._rides.extend(partition)
+                self._loaded.add(key)
+
+            self._check_ride_list()
@@ -0,0 +1,392 @@
+import json
+import os
+import threading
+from datetime import date, time
+
+from domain.Ride import Ride
+from persistence.RideJournal import RideJournal
+from persistence.RideSummary import RideSummary, RECENT_RIDES_COUNT, SUMMARY_NAME
+from utilities.InvariantHelper import require_not_none, require_state
+
+MANIFEST_NAME = "manifest.json"
+PARTITION_PREFIX = "rides-"
+PARTITION_SUFFIX = ".csv"
+
+class PartitionStats:
+    """
+    Summarizes the contents of one partition: the earliest and latest ride dates, the number of rides, and the
+    set of tracking numbers of the buses ridden. Used to skip partitions that cannot match a query.
+    """
+    def __init__(self, min_date: date, max_date: date, count: int, tracking_numbers: set[str]):
+        """
+        Creates a new instance of PartitionStats.
+
+        :param min_date: the date of the earliest ride in the partition.
+        :param max_date: the date of the latest ride in the partition.
+        :param count: the number of rides in the partition.
+        :param tracking_numbers: the tracking numbers of all buses ridden in the partition.
+        """
+        require_not_none(min_date, "Minimum date should not be None.")
+        require_not_none(max_date, "Maximum date should not be None.")
+        require_not_none(tracking_numbers, "Tracking numbers should not be None.")
+        require_state(min_date <= max_date, "Minimum date should not be after maximum date.")
+        require_state(count >= 0, "Count should not be negative.")
+
+        self.min_date: date = min_date
+        self.max_date: date = max_date
+        self.count: int = count
+        self.tracking_numbers: set[str] = tracking_numbers
+
+    @classmethod
+    def from_rides(cls, rides: list[Ride]) -> "PartitionStats | None":
+        if not rides:
+            return None
+
+        return cls(
+            min_date=min(curr.ride_date for curr in rides),
+            max_date=max(curr.ride_date for curr in rides),
+            count=len(rides),
+            tracking_numbers={curr.tracking_number for curr in rides}
+        )
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "PartitionStats":
+        return cls(
+            min_date=date.fromisoformat(raw["min_date"]),
+            max_date=date.fromisoformat(raw["max_date"]),
+            count=raw["count"],
+            tracking_numbers=set(raw["tracking_numbers"])
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "min_date": self.min_date.isoformat(),
+            "max_date": self.max_date.isoformat(),
+            "count": self.count,
+            "tracking_numbers": sorted(self.tracking_numbers)
+        }
+
+    def include(self, ride: Ride) -> None:
+        """
+        Updates these statistics to account for a ride appended to the partition.
+
+        :param ride: the ride appended to the partition.
+        """
+        self.min_date = min(self.min_date, ride.ride_date)
+        self.max_date = max(self.max_date, ride.ride_date)
+        self.count += 1
+        self.tracking_numbers.add(ride.tracking_number)
+
+    def overlaps(self, start: date | None, end: date | None) -> bool:
+        """
+        Determines whether the partition may contain rides in a given date range.
+
+        :param start: the start of the date range (inclusive), or `None` for no lower bound.
+        :param end: the end of the date range (inclusive), or `None` for no upper bound.
+        :return: True if the partition's dates overlap the date range; False otherwise.
+        """
+        return (start is None or start <= self.max_date) and (end is None or self.min_date <= end)
+
+class PartitionedRideStore:
+    """
+    Stores rides on disk partitioned by year, one RideJournal file per year, alongside a manifest holding
+    the statistics of every partition and a RideSummary of the whole history. Both are updated on every
+    write. Safe to use from multiple threads.
+    """
+    def __init__(self, directory: str):
+        """
+        Creates a new instance of PartitionedRideStore, creating `directory` if it does not exist. Rebuilds
+        the manifest and summary from the partitions if either is missing.
+
+        :param directory: the directory in which to store the partitions and manifest.
+        """
+        require_not_none(directory, "Directory should not be None.")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory: str = directory
+        self._lock = threading.RLock()
+        self._stats: dict[int, PartitionStats] = {}
+        self._ride_keys: dict[int, set[tuple[date, time]]] = {}
+        self._summary: RideSummary = RideSummary.load(self._summary_path())
+
+        if os.path.exists(self._manifest_path()) and os.path.exists(self._summary_path()):
+            self._read_manifest()
+        else:
+            self.rebuild_manifest()
+
+    def append(self, ride: Ride) -> bool:
+        """
+        Appends a given ride to the partition of its year and updates that partition's statistics and the
+        summary, or takes no action if a ride with the same date/time is already stored.
+
+        :param ride: the ride to append.
+        :return: True if the ride was appended; False if a ride with the same date/time was already stored.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        key: int = partition_key(ride.ride_date)
+
+        with self._lock:
+            ride_keys: set[tuple[date, time]] = self._get_ride_keys(key)
+
+            if (ride.ride_date, ride.boarding_time) in ride_keys:
+                return False
+
+            RideJournal(self._partition_path(key)).append(ride)
+            ride_keys.add((ride.ride_date, ride.boarding_time))
+
+            if key in self._stats:
+                self._stats[key].include(ride)
+            else:
+                self._stats[key] = PartitionStats.from_rides([ride])
+
+            self._summary.record_added(ride)
+            self._write_manifest()
+
+            return True
+
+    def remove(self, ride_date: date, boarding_time: time) -> bool:
+        """
+        Removes every ride with a given date and boarding time from its partition, rewriting that
+        partition, its statistics and the summary.
+
+        :param ride_date: the date of the ride to remove.
+        :param boarding_time: the boarding time of the ride to remove.
+        :return: True if a ride was removed; False if no such ride was stored.
+        """
+        require_not_none(ride_date, "Date should not be None.")
+        require_not_none(boarding_time, "Time should not be None.")
+
+        key: int = partition_key(ride_date)
+
+        with self._lock:
+            rides: list[Ride] = self.read_partition(key)
+            kept: list[Ride] = [curr for curr in rides
+                                if curr.ride_date != ride_date or curr.boarding_time != boarding_time]
+
+            if len(kept) == len(rides):
+                return False
+
+            self._summary.record_removed(next(curr for curr in rides if curr not in kept))
+            self._rewrite_partition(key, _remove_repeated_rides(kept))
+
+            if self._summary.is_missing_recent_rides():
+                self._refill_recent_rides()
+                self._write_manifest()
+
+            return True
+
+    def read_partition(self, key: int) -> list[Ride]:
+        """
+        Reads every ride stored in a given partition, in file order.
+
+        :param key: the key (year) of the partition to read.
+        :return: a list containing all rides in the partition, or an empty list if it does not exist.
+        """
+        with self._lock:
+            return RideJournal(self._partition_path(key)).read_rides()
+
+    def iter_sorted_rides(self):
+        """
+        Streams every ride in this store in (date, boarding time) order. Only one partition is held in
+        memory at a time.
+
+        :return: an iterator over all rides in this store, earliest first.
+        """
+        for key in self.get_partition_keys():
+            yield from sorted(self.read_partition(key), key=lambda r: (r.ride_date, r.boarding_time))
+
+    def get_partition_keys(self) -> list[int]:
+        """
+        Retrieves the keys (years) of every non-empty partition, in chronological order.
+
+        :return: a sorted list of partition keys.
+        """
+        with self._lock:
+            return sorted(self._stats)
+
+    def get_partition_stats(self, key: int) -> PartitionStats | None:
+        with self._lock:
+            return self._stats.get(key)
+
+    def get_summary(self) -> RideSummary:
+        with self._lock:
+            return self._summary
+
+    def get_partition_path(self, key: int) -> str:
+        return self._partition_path(key)
+
+    def plan(self, start: date | None = None, end: date | None = None,
+             tracking_number: str | None = None) -> list[int]:
+        """
+        Determines which partitions may contain rides matching a query, using each partition's date range
+        and tracking numbers to skip the others.
+
+        :param start: the start of the queried date range (inclusive), or `None` for no lower bound.
+        :param end: the end of the queried date range (inclusive), or `None` for no upper bound.
+        :param tracking_number: the queried tracking number, or `None` to match any bus.
+        :return: a sorted list of the keys of the partitions to read.
+        """
+        with self._lock:
+            return [key for key in sorted(self._stats)
+                    if self._stats[key].overlaps(start, end)
+                    and (tracking_number is None or tracking_number in self._stats[key].tracking_numbers)]
+
+    def rebuild_manifest(self) -> None:
+        """
+        Recomputes the statistics of every partition and the summary from the partition files, and
+        rewrites the manifest and summary.
+        """
+        with self._lock:
+            self._stats = {}
+            self._ride_keys = {}
+            all_rides: list[Ride] = []
+
+            for key in _list_partition_keys(self._directory):
+                rides: list[Ride] = _remove_repeated_rides(self.read_partition(key))
+                stats = PartitionStats.from_rides(rides)
+                if stats is not None:
+                    self._stats[key] = stats
+                    all_rides.extend(rides)
+
+            self._summary = RideSummary.from_rides(all_rides)
+            self._write_manifest()
+
+    def _rewrite_partition(self, key: int, rides: list[Ride]) -> None:
+        """
+        Replaces the contents of a partition with the given rides, and updates the manifest.
+
+        :param key: the key (year) of the partition to replace.
+        :param rides: the rides the partition should contain.
+        """
+        path: str = self._partition_path(key)
+        tmp_path: str = path + ".tmp"
+
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        journal: RideJournal = RideJournal(tmp_path)
+        for curr in rides:
+            journal.append(curr)
+
+        if rides:
+            os.replace(tmp_path, path)
+            self._stats[key] = PartitionStats.from_rides(rides)
+        else:
+            os.remove(path)
+            self._stats.pop(key, None)
+
+        self._ride_keys[key] = {(curr.ride_date, curr.boarding_time) for curr in rides}
+
+        self._write_manifest()
+
+    def _get_ride_keys(self, key: int) -> set[tuple[date, time]]:
+        """
+        Retrieves the date/time of every ride in a given partition, reading the partition the first time.
+
+        :param key: the key (year) of the partition.
+        :return: the (date, boarding time) pairs of all rides in the partition.
+        """
+        if key not in self._ride_keys:
+            self._ride_keys[key] = {(curr.ride_date, curr.boarding_time) for curr in self.read_partition(key)}
+
+        return self._ride_keys[key]
+
+    def _refill_recent_rides(self) -> None:
+        """
+        Recomputes the summary's most recent rides by reading partitions from the most recent one until
+        enough rides have been found.
+        """
+        rides: list[Ride] = []
+
+        for key in reversed(sorted(self._stats)):
+            rides.extend(_remove_repeated_rides(self.read_partition(key)))
+
+            if len(rides) >= RECENT_RIDES_COUNT:
+                break
+
+        self._summary.recent_rides = RideSummary.from_rides(rides).recent_rides
+
+    def _read_manifest(self) -> None:
+        with open(self._manifest_path(), encoding="utf-8") as manifest:
+            raw: dict = json.load(manifest)
+
+        self._stats = {int(key): PartitionStats.from_dict(value) for key, value in raw.items()}
+
+    def _write_manifest(self) -> None:
+        tmp_path: str = self._manifest_path() + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as manifest:
+            json.dump({str(key): value.to_dict() for key, value in sorted(self._stats.items())}, manifest)
+
+        os.replace(tmp_path, self._manifest_path())
+        self._summary.save(self._summary_path())
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self._directory, MANIFEST_NAME)
+
+    def _summary_path(self) -> str:
+        return os.path.join(self._directory, SUMMARY_NAME)
+
+    def _partition_path(self, key: int) -> str:
+        return os.path.join(self._directory, f"{PARTITION_PREFIX}{key}{PARTITION_SUFFIX}")
+
+def partition_key(ride_date: date) -> int:
+    """
+    Determines the partition in which rides on a given date are stored.
+
+    :param ride_date: the date of the ride.
+    :return: the key (year) of the partition containing rides on `ride_date`.
+    """
+    return ride_date.year
+
+def iter_sorted_rides(directory: str):
+    """
+    Streams every ride stored in a ride store directory in (date, boarding time) order without opening the
+    store, so nothing (such as a missing manifest or summary) is written to the directory. Only one
+    partition is held in memory at a time.
+
+    :param directory: the directory of the ride store.
+    :return: an iterator over all rides in the directory, earliest first.
+    """
+    require_not_none(directory, "Directory should not be None.")
+
+    for key in _list_partition_keys(directory):
+        path: str = os.path.join(directory, f"{PARTITION_PREFIX}{key}{PARTITION_SUFFIX}")
+        yield from sorted(RideJournal(path).read_rides(), key=lambda r: (r.ride_date, r.boarding_time))
+
+def _list_partition_keys(directory: str) -> list[int]:
+    """
+    Lists the keys (years) of every partition file in a directory, whether or not it is in the manifest.
+
+    :param directory: the directory of the ride store.
+    :return: a sorted list of partition keys.
+    """
+    keys: list[int] = []
+
+    for name in os.listdir(directory):
+        if name.startswith(PARTITION_PREFIX) and name.endswith(PARTITION_SUFFIX):
+            key_str: str = name.removeprefix(PARTITION_PREFIX).removesuffix(PARTITION_SUFFIX)
+
+            if key_str.isdigit():
+                keys.append(int(key_str))
+
+    return sorted(keys)
+
+def _remove_repeated_rides(rides: list[Ride]) -> list[Ride]:
+    """
+    Removes every ride with the same date and boarding time as an earlier ride, as in RideList.add_ride.
+
+    :param rides: the rides from which to remove repeated rides (not mutated).
+    :return: a list containing the first ride for each date and boarding time in `rides`.
+    """
+    seen: set[tuple[date, time]] = set()
+    unique: list[Ride] = []
+
+    for curr in rides:
+        if (curr.ride_date, curr.boarding_time) not in seen:
+            seen.add((curr.ride_date, curr.boarding_time))
+            unique.append(curr)
+
+    return unique
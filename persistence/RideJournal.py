@@ -0,0 +1,110 @@
+import csv
+import os
+import threading
+from datetime import date, time
+
+from domain.Ride import Ride
+from domain.RideList import RideList
+from utilities.InvariantHelper import require_not_none, require_state
+
+ROW_LENGTH = 7
+
+class RideJournal:
+    """
+    Stores rides on disk as an append-only CSV file, one ride per row. Safe to append to from a background
+    thread.
+    """
+    def __init__(self, path: str):
+        """
+        Creates a new instance of RideJournal. The file is created on the first append.
+
+        :param path: the path of the journal file.
+        """
+        require_not_none(path, "Path should not be None.")
+
+        self._path: str = path
+        self._lock = threading.Lock()
+
+    def append(self, ride: Ride) -> None:
+        """
+        Appends a given ride to the end of this journal.
+
+        :param ride: the ride to append.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        with self._lock:
+            with open(self._path, "a", newline="", encoding="utf-8") as journal:
+                csv.writer(journal).writerow(ride_to_row(ride))
+
+    def load(self) -> RideList:
+        """
+        Reads every ride in this journal into a new ride list. Later rows with the same date and boarding
+        time as an earlier row are ignored, as in RideList.add_ride.
+
+        :return: a ride list containing all rides in this journal.
+        """
+        ride_list: RideList = RideList()
+
+        for ride in self.read_rides():
+            ride_list.add_ride(ride)
+
+        return ride_list
+
+    def read_rides(self) -> list[Ride]:
+        """
+        Reads every row of this journal, in file order.
+
+        :return: a list containing the ride stored on each row, or an empty list if the file does not exist.
+        """
+        with self._lock:
+            if not os.path.exists(self._path):
+                return []
+
+            with open(self._path, newline="", encoding="utf-8") as journal:
+                return [ride_from_row(row) for row in csv.reader(journal) if row]
+
+    def iter_rides(self):
+        """
+        Streams every row of this journal, in file order, without reading the whole file into memory.
+
+        :return: an iterator over the ride stored on each row.
+        """
+        if not os.path.exists(self._path):
+            return
+
+        with open(self._path, newline="", encoding="utf-8") as journal:
+            for row in csv.reader(journal):
+                if row:
+                    yield ride_from_row(row)
+
+def ride_to_row(ride: Ride) -> list[str]:
+    """
+    Converts a ride into a CSV row of the form [YYYY-MM-DD, HH:MM, route, tracking_number, destination,
+    block_number, notes].
+
+    :param ride: the ride to convert.
+    :return: the CSV row corresponding to `ride`.
+    """
+    return [ride.ride_date.isoformat(), ride.boarding_time.strftime("%H:%M"), ride.route, ride.tracking_number,
+            ride.destination, ride.block_number, ride.notes]
+
+def ride_from_row(row: list[str]) -> Ride:
+    """
+    Converts a CSV row written by `ride_to_row` back into a ride. Raises a ValueError if the row does not
+    have one field per ride attribute.
+
+    :param row: the CSV row to convert.
+    :return: the ride stored in `row`.
+    """
+    require_state(len(row) == ROW_LENGTH, f"A ride row should have {ROW_LENGTH} fields.")
+
+    return Ride(
+        ride_date=date.fromisoformat(row[0]),
+        boarding_time=time.fromisoformat(row[1]),
+        route=row[2],
+        tracking_number=row[3],
+        destination=row[4],
+        block_number=row[5],
+        notes=row[6]
+    )
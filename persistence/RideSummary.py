@@ -0,0 +1,122 @@
+import json
+import os
+from collections.abc import Iterable
+
+from domain.Ride import Ride
+from logic.RideMetrics import count_rides_per_vehicle, get_most_frequent_vehicles, get_most_recent_rides
+from persistence.RideJournal import ride_from_row, ride_to_row
+from utilities.InvariantHelper import require_not_none
+
+RECENT_RIDES_COUNT = 5
+SUMMARY_NAME = "summary.json"
+
+class RideSummary:
+    """
+    Represents a small precomputed summary of the ride history: the most recent rides and the number of rides
+    on each bus. Kept up to date on every write so the welcome screen can be shown without loading the
+    history.
+    """
+    def __init__(self, recent_rides: list[Ride], total_rides: int, rides_per_vehicle: dict[str, int]):
+        """
+        Creates a new instance of RideSummary.
+
+        :param recent_rides: the most recent rides (at most 5), most recent first.
+        :param total_rides: the total number of rides in the history.
+        :param rides_per_vehicle: a dictionary mapping each tracking number to its number of rides.
+        """
+        require_not_none(recent_rides, "Recent rides should not be None.")
+        require_not_none(rides_per_vehicle, "Rides per vehicle should not be None.")
+
+        self.recent_rides: list[Ride] = recent_rides
+        self.total_rides: int = total_rides
+        self.rides_per_vehicle: dict[str, int] = rides_per_vehicle
+
+    @classmethod
+    def from_rides(cls, rides: Iterable[Ride]) -> "RideSummary":
+        rides = list(rides)
+
+        return cls(
+            recent_rides=get_most_recent_rides(rides, RECENT_RIDES_COUNT),
+            total_rides=len(rides),
+            rides_per_vehicle=count_rides_per_vehicle(rides)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RideSummary":
+        """
+        Reads a summary previously saved at a given path.
+
+        :param path: the path of the summary file.
+        :return: the summary stored at `path`, or an empty summary if the file does not exist.
+        """
+        require_not_none(path, "Path should not be None.")
+
+        if not os.path.exists(path):
+            return cls([], 0, {})
+
+        with open(path, encoding="utf-8") as summary:
+            raw: dict = json.load(summary)
+
+        return cls(
+            recent_rides=[ride_from_row(row) for row in raw["recent_rides"]],
+            total_rides=raw["total_rides"],
+            rides_per_vehicle=raw["rides_per_vehicle"]
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Writes this summary to a given path, replacing any previous summary atomically.
+
+        :param path: the path of the summary file.
+        """
+        require_not_none(path, "Path should not be None.")
+
+        tmp_path: str = path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as summary:
+            json.dump({
+                "recent_rides": [ride_to_row(curr) for curr in self.recent_rides],
+                "total_rides": self.total_rides,
+                "rides_per_vehicle": self.rides_per_vehicle
+            }, summary)
+
+        os.replace(tmp_path, path)
+
+    def record_added(self, ride: Ride) -> None:
+        """
+        Updates this summary to account for a ride added to the history.
+
+        :param ride: the added ride.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        self.total_rides += 1
+        self.rides_per_vehicle[ride.tracking_number] = self.rides_per_vehicle.get(ride.tracking_number, 0) + 1
+        self.recent_rides = get_most_recent_rides(self.recent_rides + [ride], RECENT_RIDES_COUNT)
+
+    def record_removed(self, ride: Ride) -> None:
+        """
+        Updates this summary to account for a ride removed from the history. If the ride was one of the
+        most recent rides, the list of recent rides may become incomplete (see `is_missing_recent_rides`).
+
+        :param ride: the removed ride.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        self.total_rides -= 1
+        self.rides_per_vehicle[ride.tracking_number] -= 1
+
+        if self.rides_per_vehicle[ride.tracking_number] == 0:
+            del self.rides_per_vehicle[ride.tracking_number]
+
+        if ride in self.recent_rides:
+            self.recent_rides.remove(ride)
+
+    def is_missing_recent_rides(self) -> bool:
+        return len(self.recent_rides) < min(RECENT_RIDES_COUNT, self.total_rides)
+
+    def get_unique_vehicle_count(self) -> int:
+        return len(self.rides_per_vehicle)
+
+    def get_most_frequent_vehicles(self, count: int) -> list[tuple[str, int]]:
+        return get_most_frequent_vehicles(self.rides_per_vehicle, count)
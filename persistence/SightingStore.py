@@ -0,0 +1,193 @@
+import csv
+import os
+import threading
+from datetime import date, datetime, time
+
+from domain.Sighting import Sighting
+from utilities.InvariantHelper import require_not_none
+
+PARTITION_SUFFIX = ".csv"
+
+class SightingStore:
+    """
+    Stores bus sightings on disk, partitioned into one compact CSV file per day. Each row holds the time of
+    day, tracking number, route, latitude and longitude of one sighting. Safe to append to from a background
+    thread while other threads query it; partitions are read outside the lock, so queries do not hold up
+    appends.
+    """
+    def __init__(self, directory: str):
+        """
+        Creates a new instance of SightingStore, creating `directory` if it does not exist.
+
+        :param directory: the directory in which to store the daily partitions.
+        """
+        require_not_none(directory, "Directory should not be None.")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory: str = directory
+        self._lock = threading.Lock()
+        self._latest: dict[str, Sighting] = {}
+        self._scanned_days: set[date] = set()
+
+    def append(self, sightings: list[Sighting]) -> None:
+        """
+        Appends a batch of sightings to the partitions of the days on which they were made.
+
+        :param sightings: the sightings to append.
+        """
+        require_not_none(sightings, "Sightings should not be None.")
+
+        by_day: dict[date, list[Sighting]] = {}
+        for curr in sightings:
+            by_day.setdefault(curr.seen_at.date(), []).append(curr)
+
+        with self._lock:
+            for day, day_sightings in by_day.items():
+                path: str = self._partition_path(day)
+
+                if not os.path.exists(path):
+                    self._scanned_days.add(day)
+
+                with open(path, "a", newline="", encoding="utf-8") as partition:
+                    writer = csv.writer(partition)
+                    for curr in day_sightings:
+                        writer.writerow([curr.seen_at.time().isoformat("seconds"), curr.tracking_number,
+                                         curr.route, f"{curr.latitude:.6f}", f"{curr.longitude:.6f}"])
+
+            for curr in sightings:
+                self._remember(curr)
+
+    def get_latest_sighting(self, tracking_number: str) -> Sighting | None:
+        """
+        Retrieves the most recent sighting of a bus with a given tracking number. Daily partitions are
+        scanned newest first, and each is scanned at most once: the latest sighting of every bus in a scanned
+        partition is remembered, so one scan answers the query for all of them.
+
+        :param tracking_number: the 3-digit tracking number of the bus.
+        :return: the most recent sighting of bus `tracking_number`, or `None` if it has never been seen.
+        """
+        require_not_none(tracking_number, "Tracking number should not be None.")
+
+        tracking_number = tracking_number.strip()
+
+        with self._lock:
+            if tracking_number in self._latest:
+                return self._latest[tracking_number]
+
+            days: list[date] = [day for day in reversed(self.get_days()) if day not in self._scanned_days]
+
+        for day in days:
+            latest: dict[str, str] = {}
+            for line in reversed(self._read_lines(day)):
+                latest.setdefault(_tracking_number_of(line), line)
+
+            with self._lock:
+                if day not in self._scanned_days:
+                    self._scanned_days.add(day)
+                    for line in latest.values():
+                        self._remember(_sighting_from_line(day, line))
+
+                if tracking_number in self._latest:
+                    return self._latest[tracking_number]
+
+        with self._lock:
+            return self._latest.get(tracking_number)
+
+    def get_sightings(self, tracking_number: str, day: date) -> list[Sighting]:
+        """
+        Retrieves all sightings of a bus with a given tracking number on a given day, in the order they
+        were made.
+
+        :param tracking_number: the 3-digit tracking number of the bus.
+        :param day: the day for which to retrieve sightings.
+        :return: a list containing all sightings of bus `tracking_number` on `day`.
+        """
+        require_not_none(tracking_number, "Tracking number should not be None.")
+        require_not_none(day, "Day should not be None.")
+
+        tracking_number = tracking_number.strip()
+
+        return [_sighting_from_line(day, line) for line in self._read_lines(day)
+                if _tracking_number_of(line) == tracking_number]
+
+    def get_days(self) -> list[date]:
+        """
+        Retrieves every day for which at least one sighting is stored, in chronological order.
+
+        :return: a sorted list of the days with a partition in this store.
+        """
+        days: list[date] = []
+
+        for name in os.listdir(self._directory):
+            if name.endswith(PARTITION_SUFFIX):
+                try:
+                    days.append(date.fromisoformat(name.removesuffix(PARTITION_SUFFIX)))
+                except ValueError:
+                    continue
+
+        return sorted(days)
+
+    def _remember(self, sighting: Sighting) -> None:
+        """
+        Records `sighting` as the latest known sighting of its bus if it is more recent than the one
+        already recorded.
+
+        :param sighting: the sighting to record.
+        """
+        prev: Sighting | None = self._latest.get(sighting.tracking_number)
+
+        if prev is None or prev.seen_at <= sighting.seen_at:
+            self._latest[sighting.tracking_number] = sighting
+
+    def _read_lines(self, day: date) -> list[str]:
+        """
+        Reads every non-blank line from the partition of a given day, in the order they were appended. Only
+        the lines fully written when this method is called are read, so the lock is not held while reading.
+
+        :param day: the day whose partition to read.
+        :return: a list containing all lines of the partition of `day`, or an empty list if there are none.
+        """
+        path: str = self._partition_path(day)
+
+        with self._lock:
+            if not os.path.exists(path):
+                return []
+
+            size: int = os.path.getsize(path)
+
+        with open(path, "rb") as partition:
+            content: str = partition.read(size).decode("utf-8")
+
+        return [line for line in content.splitlines() if line]
+
+    def _partition_path(self, day: date) -> str:
+        return os.path.join(self._directory, day.isoformat() + PARTITION_SUFFIX)
+
+def _tracking_number_of(line: str) -> str:
+    """
+    Retrieves the tracking number from a line of a partition without parsing the rest of the line. The time
+    of day before it never contains a comma, so this does not need a CSV reader.
+
+    :param line: the line to read.
+    :return: the tracking number stored in `line`.
+    """
+    return line.split(",", 2)[1]
+
+def _sighting_from_line(day: date, line: str) -> Sighting:
+    """
+    Creates a sighting from a line of the partition of a given day.
+
+    :param day: the day of the partition the line was read from.
+    :param line: the line to convert.
+    :return: the sighting stored in `line`.
+    """
+    row: list[str] = next(csv.reader([line]))
+
+    return Sighting(
+        seen_at=datetime.combine(day, time.fromisoformat(row[0])),
+        tracking_number=row[1],
+        route=row[2],
+        latitude=float(row[3]),
+        longitude=float(row[4])
+    )
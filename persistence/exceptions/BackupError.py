@@ -0,0 +1,17 @@
+class BackupError(Exception):
+    """
+    Exception thrown when a backup cannot be created, read or restored.
+    """
+    pass
+
+class RepositoryNotFoundError(BackupError):
+    pass
+
+class SnapshotNotFoundError(BackupError):
+    pass
+
+class CorruptBackupError(BackupError):
+    pass
+
+class MissingFileError(BackupError):
+    pass
@@ -0,0 +1,80 @@
+import json
+import socket
+import struct
+
+from service.exceptions.ServiceError import ProtocolError
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+OP_KEY = "op"
+ARGS_KEY = "args"
+OK_KEY = "ok"
+RESULT_KEY = "result"
+ERROR_KEY = "error"
+
+def send_frame(sock: socket.socket, payload) -> None:
+    """
+    Sends a payload as one frame: a 4-byte big-endian length followed by the
+    payload encoded as compact UTF-8 JSON.
+
+    :param sock: the connected socket to send the frame on.
+    :param payload: the JSON-serializable payload to send.
+    """
+    body: bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError("Frame is too large.")
+
+    sock.sendall(HEADER.pack(len(body)) + body)
+
+def receive_frame(sock: socket.socket):
+    """
+    Receives one frame sent by `send_frame`. Raises a ProtocolError if the
+    frame is too large, malformed, or cut short.
+
+    :param sock: the connected socket to receive the frame from.
+    :return: the decoded payload, or `None` if the peer closed the connection
+    before a new frame started.
+    """
+    header: bytes | None = _receive_exactly(sock, HEADER.size)
+
+    if header is None:
+        return None
+
+    (length,) = HEADER.unpack(header)
+
+    if length > MAX_FRAME_SIZE:
+        raise ProtocolError("Frame is too large.")
+
+    body: bytes | None = _receive_exactly(sock, length)
+
+    if body is None:
+        raise ProtocolError("Connection closed in the middle of a frame.")
+
+    try:
+        return json.loads(body.decode("utf-8"))
+    except ValueError:
+        raise ProtocolError("Frame is not valid JSON.")
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes | None:
+    """
+    Receives exactly `size` bytes from a socket.
+
+    :param sock: the connected socket to receive from.
+    :param size: the number of bytes to receive.
+    :return: the received bytes, or `None` if the connection was closed
+    before any byte was received.
+    """
+    data: bytearray = bytearray()
+
+    while len(data) < size:
+        chunk: bytes = sock.recv(size - len(data))
+
+        if not chunk:
+            if not data:
+                return None
+            raise ProtocolError("Connection closed in the middle of a frame.")
+
+        data.extend(chunk)
+
+    return bytes(data)
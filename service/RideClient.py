@@ -0,0 +1,117 @@
+import socket
+import threading
+from datetime import date, time
+
+from domain.Ride import Ride
+from logic.RideManager import RideFilter
+from persistence.RideJournal import ride_from_row, ride_to_row
+from service.Protocol import send_frame, receive_frame, OP_KEY, ARGS_KEY, OK_KEY, RESULT_KEY, ERROR_KEY
+from service.exceptions.ServiceError import ProtocolError, RequestError
+from utilities.InvariantHelper import require_not_none
+
+class RideClient:
+    """
+    Connects to a RideDaemon over its Unix socket. Requests can be sent one at a time or batched into a
+    single round trip. Safe to share between threads.
+    """
+    def __init__(self, socket_path: str):
+        """
+        Creates a new instance of RideClient connected to the daemon listening on `socket_path`.
+
+        :param socket_path: the path of the daemon's Unix socket.
+        """
+        require_not_none(socket_path, "Socket path should not be None.")
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(socket_path)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RideClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def batch(self, requests: list[tuple]) -> list:
+        """
+        Sends several requests in a single frame and waits for all their responses.
+
+        :param requests: a list of (operation, argument, ...) tuples, e.g. ("get", "2025-01-31", "08:15").
+        :return: a list containing the result of each request, or a RequestError in place of the result of
+        each request that failed.
+        """
+        require_not_none(requests, "Requests should not be None.")
+
+        with self._lock:
+            send_frame(self._socket, [{OP_KEY: curr[0], ARGS_KEY: list(curr[1:])} for curr in requests])
+            responses = receive_frame(self._socket)
+
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            raise ProtocolError("Daemon sent an unexpected response.")
+
+        return [response[RESULT_KEY] if response[OK_KEY] else RequestError(response[ERROR_KEY])
+                for response in responses]
+
+    def add_ride(self, ride: Ride) -> bool:
+        """
+        Adds a ride to the daemon's ride list.
+
+        :param ride: the ride to add.
+        :return: True if the ride was added; False if a ride with the same date/time already existed.
+        """
+        require_not_none(ride, "Ride should not be None.")
+
+        return self._call("add", ride_to_row(ride))
+
+    def get_ride(self, ride_date: date, boarding_time: time) -> Ride | None:
+        """
+        Retrieves the ride with a given date and boarding time from the daemon's ride list.
+
+        :param ride_date: the date of the ride to retrieve.
+        :param boarding_time: the boarding time of the ride to retrieve.
+        :return: the ride corresponding to `ride_date` and `boarding_time`, or `None` if no such ride exists.
+        """
+        row: list[str] | None = self._call("get", ride_date.isoformat(), boarding_time.strftime("%H:%M"))
+
+        return ride_from_row(row) if row is not None else None
+
+    def remove_ride(self, ride_date: date, boarding_time: time) -> bool:
+        """
+        Removes the ride with a given date and boarding time from the daemon's ride list.
+
+        :param ride_date: the date of the ride to remove.
+        :param boarding_time: the boarding time of the ride to remove.
+        :return: True if a ride was removed; False if no such ride existed.
+        """
+        return self._call("remove", ride_date.isoformat(), boarding_time.strftime("%H:%M"))
+
+    def filter_rides(self, ride_filter: RideFilter, *values: str) -> list[Ride]:
+        """
+        Retrieves the rides of the daemon's ride list matching a given filter.
+
+        :param ride_filter: the filter to apply.
+        :param values: the filter's values as strings (start and end in ISO format for DATE and TIME, a
+        single value otherwise, none for NONE).
+        :return: a list containing all matching rides.
+        """
+        return [ride_from_row(row) for row in self._call("filter", ride_filter.value, *values)]
+
+    def get_metrics(self) -> dict:
+        """
+        Retrieves the metrics of the daemon's ride list: total rides, unique vehicles, rides per route, rides
+        per block and the most frequently ridden vehicles.
+
+        :return: a dictionary mapping each metric name to its value.
+        """
+        return self._call("metrics")
+
+    def _call(self, operation: str, *args):
+        result = self.batch([(operation, *args)])[0]
+
+        if isinstance(result, RequestError):
+            raise result
+
+        return result
@@ -0,0 +1,248 @@
+import os
+import socketserver
+import stat
+import sys
+import threading
+from datetime import date, time
+
+from domain.ConcurrentRideList import ConcurrentRideList
+from domain.Ride import Ride
+from domain.RideList import RideList
+from logic.RideManager import (RideFilter, filter_by_date, filter_by_time, filter_by_route, filter_by_tracking_number,
+                               filter_by_block_number, filter_by_destination)
+from logic.RideMetrics import (count_unique_vehicles, count_rides_per_route, count_rides_per_block,
+                               count_rides_per_vehicle, get_most_frequent_vehicles)
+from persistence.RideJournal import ride_from_row, ride_to_row
+from service.Protocol import send_frame, receive_frame, OP_KEY, ARGS_KEY, OK_KEY, RESULT_KEY, ERROR_KEY
+from service.exceptions.ServiceError import ProtocolError, RequestError, InvalidSocketPathError
+from utilities.InvariantHelper import require_not_none
+
+MOST_FREQUENT_VEHICLES_COUNT = 10
+
+class RideDaemon:
+    """
+    Serves one shared ride list to local clients over a Unix socket, so that several processes can read and
+    modify the same ride history without each loading its own copy. Each client frame holds a batch of
+    requests (add, get, remove, filter, metrics) and is answered with one frame holding a response per
+    request. Every client connection is handled on its own thread. Adds and removes update the ride list
+    and the store under a single lock, and are rolled back in memory if the store cannot be written.
+    """
+    def __init__(self, socket_path: str, ride_list: ConcurrentRideList, store=None):
+        """
+        Creates a new instance of RideDaemon. The daemon does nothing until it is started.
+
+        :param socket_path: the path of the Unix socket to listen on.
+        :param ride_list: the ride list to serve.
+        :param store: the store to which added and removed rides are persisted (any object with
+        `append(ride)` and `remove(ride_date, boarding_time)` methods), or `None` to keep changes in memory.
+        """
+        require_not_none(socket_path, "Socket path should not be None.")
+        require_not_none(ride_list, "Ride list should not be None.")
+
+        self._socket_path: str = socket_path
+        self._ride_list: ConcurrentRideList = ride_list
+        self._store = store
+        self._write_lock = threading.Lock()
+        self._server: socketserver.ThreadingUnixStreamServer | None = None
+        self._thread: threading.Thread | None = None
+        self._operations = {
+            "add": self._add,
+            "get": self._get,
+            "remove": self._remove,
+            "filter": self._filter,
+            "metrics": self._metrics
+        }
+
+    def start(self) -> None:
+        """
+        Starts serving on a daemon thread, or takes no action if the daemon is already running.
+        """
+        if self._thread is not None:
+            return
+
+        self._open_server()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ride-daemon", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Serves on the calling thread until `stop` is called from another thread.
+        """
+        self._open_server()
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """
+        Stops serving, closes the socket and removes its file.
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._remove_socket_file()
+
+    def handle_batch(self, requests: list) -> list[dict]:
+        """
+        Executes a batch of requests in order. Every request gets a response: a request that fails for any
+        reason (unknown operation, malformed arguments, store failure) is answered with an error and does not
+        prevent later requests in the batch from running.
+
+        :param requests: a list of requests of the form {"op": name, "args": [...]}.
+        :return: a list containing one response per request, of the form {"ok": true, "result": ...} or
+        {"ok": false, "error": message}.
+        """
+        if not isinstance(requests, list):
+            raise ProtocolError("A frame should contain a list of requests.")
+
+        responses: list[dict] = []
+
+        for request in requests:
+            try:
+                responses.append({OK_KEY: True, RESULT_KEY: self._handle_request(request)})
+            except Exception as e:
+                responses.append({OK_KEY: False, ERROR_KEY: f"{type(e).__name__}: {e}"})
+
+        return responses
+
+    def _open_server(self) -> None:
+        self._remove_socket_file()
+
+        self._server = socketserver.ThreadingUnixStreamServer(self._socket_path, _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.ride_daemon = self
+
+    def _remove_socket_file(self) -> None:
+        """
+        Removes a socket left at the socket path (e.g. by a daemon that crashed). Raises an
+        InvalidSocketPathError if something other than a socket is at that path.
+        """
+        try:
+            mode: int = os.lstat(self._socket_path).st_mode
+        except FileNotFoundError:
+            return
+
+        if not stat.S_ISSOCK(mode):
+            raise InvalidSocketPathError(f"{self._socket_path} exists and is not a socket.")
+
+        os.remove(self._socket_path)
+
+    def _handle_request(self, request: dict):
+        if not isinstance(request, dict) or request.get(OP_KEY) not in self._operations:
+            raise RequestError("Unknown operation.")
+
+        return self._operations[request[OP_KEY]](*request.get(ARGS_KEY, []))
+
+    def _add(self, row: list[str]) -> bool:
+        ride: Ride = ride_from_row(row)
+
+        with self._write_lock:
+            if not self._ride_list.try_add_ride(ride):
+                return False
+
+            if self._store is not None:
+                try:
+                    self._store.append(ride)
+                except OSError:
+                    self._ride_list.try_remove_ride(ride.ride_date, ride.boarding_time)
+                    raise
+
+            return True
+
+    def _get(self, ride_date: str, boarding_time: str) -> list[str] | None:
+        ride: Ride | None = self._ride_list.get_ride(date.fromisoformat(ride_date), time.fromisoformat(boarding_time))
+
+        return ride_to_row(ride) if ride is not None else None
+
+    def _remove(self, ride_date: str, boarding_time: str) -> bool:
+        key = (date.fromisoformat(ride_date), time.fromisoformat(boarding_time))
+
+        with self._write_lock:
+            removed: Ride | None = self._ride_list.try_remove_ride(*key)
+
+            if removed is not None and self._store is not None:
+                try:
+                    self._store.remove(*key)
+                except OSError:
+                    self._ride_list.try_add_ride(removed)
+                    raise
+
+            return removed is not None
+
+    def _filter(self, filter_name: str, *values: str) -> list[list[str]]:
+        ride_filter: RideFilter = RideFilter.from_string(filter_name)
+
+        if ride_filter == RideFilter.DATE:
+            result: RideList = filter_by_date(self._ride_list, date.fromisoformat(values[0]),
+                                              date.fromisoformat(values[1]))
+        elif ride_filter == RideFilter.TIME:
+            result = filter_by_time(self._ride_list, time.fromisoformat(values[0]), time.fromisoformat(values[1]))
+        elif ride_filter == RideFilter.ROUTE:
+            result = filter_by_route(self._ride_list, values[0])
+        elif ride_filter == RideFilter.TRACKING_NUMBER:
+            result = filter_by_tracking_number(self._ride_list, values[0])
+        elif ride_filter == RideFilter.BLOCK_ID:
+            result = filter_by_block_number(self._ride_list, values[0])
+        elif ride_filter == RideFilter.DESTINATION:
+            result = filter_by_destination(self._ride_list, values[0])
+        else:
+            result = self._ride_list
+
+        return [ride_to_row(curr) for curr in result]
+
+    def _metrics(self) -> dict:
+        rides: list[Ride] = list(self._ride_list)
+
+        return {
+            "total_rides": len(rides),
+            "unique_vehicles": count_unique_vehicles(rides),
+            "rides_per_route": count_rides_per_route(rides),
+            "rides_per_block": count_rides_per_block(rides),
+            "most_frequent_vehicles": get_most_frequent_vehicles(count_rides_per_vehicle(rides),
+                                                                 MOST_FREQUENT_VEHICLES_COUNT)
+        }
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """
+    Handles one client connection: answers each batch frame until the client disconnects or sends a
+    malformed frame.
+    """
+    def handle(self) -> None:
+        daemon: RideDaemon = self.server.ride_daemon
+
+        try:
+            while (requests := receive_frame(self.request)) is not None:
+                send_frame(self.request, daemon.handle_batch(requests))
+        except (ProtocolError, OSError):
+            return
+
+def main():
+    """
+    Runs the daemon in the foreground over the ride store in the directory given as the first argument,
+    listening on the socket path given as the second argument.
+    """
+    from persistence.PartitionedRideStore import PartitionedRideStore
+
+    if len(sys.argv) != 3:
+        print("Usage: python -m service.RideDaemon <rides directory> <socket path>")
+        sys.exit(2)
+
+    store = PartitionedRideStore(sys.argv[1])
+    ride_list = ConcurrentRideList()
+    ride_list.add_rides(store.iter_sorted_rides())
+
+    daemon = RideDaemon(sys.argv[2], ride_list, store)
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+
+if __name__ == "__main__":
+    main()
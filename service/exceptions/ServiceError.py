@@ -0,0 +1,14 @@
+class ServiceError(Exception):
+    """
+    Exception thrown when a request to the ride daemon fails.
+    """
+    pass
+
+class ProtocolError(ServiceError):
+    pass
+
+class RequestError(ServiceError):
+    pass
+
+class InvalidSocketPathError(ServiceError):
+    pass
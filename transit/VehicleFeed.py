@@ -0,0 +1,151 @@
+import json
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+from domain.Sighting import Sighting
+from transit.exceptions.FeedError import FeedUnavailableError, FeedFormatError, FeedExhaustedError
+from utilities.InvariantHelper import require_not_none
+
+REQUEST_TIMEOUT_SECONDS = 10
+POLLED_AT_KEY = "polled-at"
+VEHICLES_KEY = "vehicles"
+TRACKING_NUMBER_KEY = "tracking-number"
+ROUTE_KEY = "route"
+LATITUDE_KEY = "latitude"
+LONGITUDE_KEY = "longitude"
+
+class LiveVehicleFeed:
+    """
+    Reads the current position of every bus from a vehicle-positions endpoint of the Winnipeg Transit API.
+    The endpoint should return a JSON object of the form {"vehicles": [{"tracking-number", "route",
+    "latitude", "longitude"}, ...]}.
+    """
+    def __init__(self, url: str, timeout: float = REQUEST_TIMEOUT_SECONDS):
+        """
+        Creates a new instance of LiveVehicleFeed.
+
+        :param url: the full URL of the vehicle-positions endpoint (including the API key).
+        :param timeout: the number of seconds to wait for a response before giving up.
+        """
+        require_not_none(url, "URL should not be None.")
+
+        self._url: str = url
+        self._timeout: float = timeout
+
+    def fetch(self) -> list[Sighting]:
+        """
+        Retrieves one snapshot of the positions of all buses currently reporting.
+
+        :return: a list containing one sighting per bus in the snapshot.
+        """
+        try:
+            with urllib.request.urlopen(self._url, timeout=self._timeout) as response:
+                payload = json.load(response)
+        except (urllib.error.URLError, TimeoutError, OSError):
+            raise FeedUnavailableError()
+        except ValueError:
+            raise FeedFormatError()
+
+        return parse_snapshot(payload, datetime.now())
+
+class ReplayVehicleFeed:
+    """
+    Replays snapshots previously recorded by a RecordingVehicleFeed, one snapshot per fetch. Used to exercise
+    the poller without the live API.
+    """
+    def __init__(self, path: str):
+        """
+        Creates a new instance of ReplayVehicleFeed.
+
+        :param path: the path of the recording to replay (one JSON snapshot per line).
+        """
+        require_not_none(path, "Recording path should not be None.")
+
+        with open(path, encoding="utf-8") as recording:
+            self._lines: list[str] = [line for line in recording if line.strip()]
+
+        self._next: int = 0
+
+    def fetch(self) -> list[Sighting]:
+        """
+        Retrieves the next recorded snapshot, with each sighting timestamped at the time it was recorded.
+        Raises a FeedExhaustedError once every snapshot has been replayed.
+
+        :return: a list containing one sighting per bus in the next snapshot.
+        """
+        if self._next >= len(self._lines):
+            raise FeedExhaustedError()
+
+        line: str = self._lines[self._next]
+        self._next += 1
+
+        try:
+            payload = json.loads(line)
+            polled_at = datetime.fromisoformat(payload[POLLED_AT_KEY])
+        except (ValueError, KeyError, TypeError):
+            raise FeedFormatError()
+
+        return parse_snapshot(payload, polled_at)
+
+class RecordingVehicleFeed:
+    """
+    Wraps another feed and appends every snapshot it returns to a recording that ReplayVehicleFeed can
+    later replay.
+    """
+    def __init__(self, feed, path: str):
+        """
+        Creates a new instance of RecordingVehicleFeed.
+
+        :param feed: the feed to record.
+        :param path: the path of the recording to append to.
+        """
+        require_not_none(feed, "Feed should not be None.")
+        require_not_none(path, "Recording path should not be None.")
+
+        self._feed = feed
+        self._path: str = path
+
+    def fetch(self) -> list[Sighting]:
+        """
+        Retrieves one snapshot from the wrapped feed and records it.
+
+        :return: the sightings returned by the wrapped feed.
+        """
+        sightings: list[Sighting] = self._feed.fetch()
+        polled_at: datetime = sightings[0].seen_at if sightings else datetime.now()
+
+        snapshot = {
+            POLLED_AT_KEY: polled_at.isoformat(),
+            VEHICLES_KEY: [{
+                TRACKING_NUMBER_KEY: curr.tracking_number,
+                ROUTE_KEY: curr.route,
+                LATITUDE_KEY: curr.latitude,
+                LONGITUDE_KEY: curr.longitude
+            } for curr in sightings]
+        }
+
+        with open(self._path, "a", encoding="utf-8") as recording:
+            recording.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+
+        return sightings
+
+def parse_snapshot(payload, polled_at: datetime) -> list[Sighting]:
+    """
+    Converts a decoded vehicle-positions snapshot into sightings. Raises a FeedFormatError if the snapshot
+    is malformed.
+
+    :param payload: the decoded JSON snapshot.
+    :param polled_at: the time at which the snapshot was taken.
+    :return: a list containing one sighting per bus in `payload`.
+    """
+    try:
+        return [Sighting(
+            seen_at=polled_at,
+            tracking_number=str(vehicle[TRACKING_NUMBER_KEY]),
+            route=str(vehicle.get(ROUTE_KEY) or ""),
+            latitude=vehicle[LATITUDE_KEY],
+            longitude=vehicle[LONGITUDE_KEY]
+        ) for vehicle in payload[VEHICLES_KEY]]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise FeedFormatError()
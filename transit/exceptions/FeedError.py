@@ -0,0 +1,14 @@
+class FeedError(Exception):
+    """
+    Exception thrown when the vehicle-positions feed cannot be read.
+    """
+    pass
+
+class FeedUnavailableError(FeedError):
+    pass
+
+class FeedFormatError(FeedError):
+    pass
+
+class FeedExhaustedError(FeedError):
+    pass
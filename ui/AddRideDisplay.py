@@ -1,10 +1,14 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from domain.Ride import Ride
+from domain.Sighting import Sighting
 from domain.RideList import RideList
 from domain.validation.exceptions.RideError import (EmptyBlockNumberError, EmptyDestinationError, EmptyRouteError,
                                                     InvalidBlockNumberError, TrackingNumberDigitError,
                                                     TrackingNumberLengthError, RideError, InvalidDateError,
                                                     InvalidTimeError)
-from ui.printing.RidePrinter import print_ride_compact
+from transit.exceptions.FeedError import FeedError
+from ui.printing.RidePrinter import print_ride_compact, print_sighting
 from utilities.InvariantHelper import require_state
 from utilities.PrintHelper import print_error, print_success
 from domain.validation.ValidateRide import CURR_DATE_KEYWORD, validate_date, validate_boarding_time, validate_route, \
@@ -12,28 +16,46 @@ from domain.validation.ValidateRide import CURR_DATE_KEYWORD, validate_date, val
 
 NUM_TOKENS_WITH_NOTES = 7
 NUM_TOKENS_WITHOUT_NOTES = 6
+PREFETCH_WORKERS = 3
 
-def add_ride(ride_list: RideList) -> None:
+def add_ride(ride_list: RideList, locator=None, journal=None) -> None:
     """
     Creates a ride from user input and adds it to the given ride list.
     Repeatedly prompts the user for each field until they enter a valid
-    input.
+    input. Slow lookups (duplicate check, previous rides on the bus and
+    its current location) run in the background while the user fills in
+    the remaining fields, and the ride is written to the journal in the
+    background once it is confirmed. If the ride is a duplicate, the
+    pending lookups are abandoned rather than waited for.
 
     :param ride_list: the ride list to add the ride to.
+    :param locator: a function returning the latest sighting of the bus
+    with a given tracking number (or `None`), or `None` to skip the
+    location lookup.
+    :param journal: the journal to which to append the ride (any object
+    with an `append(ride)` method), or `None` to skip persisting it.
     """
+    executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
 
-    ride_date = _prompter(f"Enter the date of the ride (YYYY-MM-DD or '{CURR_DATE_KEYWORD}'): ", validate_date)
-    boarding_time = _prompter("Enter boarding time (HH:MM): ", validate_boarding_time)
-    route = _prompter("Enter route (e.g. FX2): ", validate_route)
-    tracking_number = _prompter("Enter the bus's 3-digit tracking number (e.g. 971): ", validate_tracking_number)
-    destination = _prompter("Enter the route's destination (e.g. Markham Station): ", validate_destination)
-    block_number = _prompter("Enter the block ID (e.g. 171-7): ", validate_block_number)
-    notes = input("Enter any additional notes (can be blank): ")
+    try:
+        ride_date = _prompter(f"Enter the date of the ride (YYYY-MM-DD or '{CURR_DATE_KEYWORD}'): ", validate_date)
+        boarding_time = _prompter("Enter boarding time (HH:MM): ", validate_boarding_time)
+        existing_future: Future = executor.submit(ride_list.get_ride, ride_date, boarding_time)
 
-    if ride_list.get_ride(ride_date, boarding_time):
-        print_error("A ride with this date and boarding time already exists.")
-    else:
-        ride_list.add_ride(Ride(
+        route = _prompter("Enter route (e.g. FX2): ", validate_route)
+        tracking_number = _prompter("Enter the bus's 3-digit tracking number (e.g. 971): ", validate_tracking_number)
+        prev_rides_future: Future = executor.submit(ride_list.get_rides_on_bus, tracking_number)
+        location_future: Future | None = executor.submit(locator, tracking_number) if locator else None
+
+        destination = _prompter("Enter the route's destination (e.g. Markham Station): ", validate_destination)
+        block_number = _prompter("Enter the block ID (e.g. 171-7): ", validate_block_number)
+        notes = input("Enter any additional notes (can be blank): ")
+
+        if existing_future.result():
+            print_error("A ride with this date and boarding time already exists.")
+            return
+
+        ride = Ride(
             ride_date=ride_date,
             boarding_time=boarding_time,
             route=route,
@@ -41,17 +63,35 @@ def add_ride(ride_list: RideList) -> None:
             destination=destination,
             block_number=block_number,
             notes=notes
-        ))
+        )
+        ride_list.add_ride(ride)
+        journal_future: Future | None = executor.submit(journal.append, ride) if journal else None
+
         print_success("Added ride.")
-        _display_previous_rides(ride_list, tracking_number)
+        prev_rides: list[Ride] = [curr for curr in prev_rides_future.result() if curr != ride]
+        _display_previous_rides(prev_rides + [ride], tracking_number)
+        _display_location(location_future)
 
-def add_rides_quick(ride_list: RideList) -> None:
+        if journal_future is not None:
+            try:
+                journal_future.result()
+            except OSError:
+                print_error("Could not save ride to the journal.")
+    finally:
+        # Every lookup still needed has been waited for; don't keep the user waiting on the rest (e.g. a
+        # slow location lookup for a duplicate ride).
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def add_rides_quick(ride_list: RideList, journal=None) -> None:
     """
     Creates rides in succession from single-line CSV input and adds them
     to the given ride list until the user enters 'quit'. Prints error
     messages and prompts the user again if any inputs is invalid.
 
     :param ride_list: the ride list to add the ride to.
+    :param journal: the journal to which to append each new ride (any
+    object with an `append(ride)` method), or `None` to skip persisting
+    them.
     """
     QUIT_KEYWORD = "quit"
 
@@ -74,12 +114,18 @@ def add_rides_quick(ride_list: RideList) -> None:
         else:
             try:
                 ride: Ride = _create_ride_from_tokens(tokens)
+
+                if journal is not None and not ride_list.get_ride(ride.ride_date, ride.boarding_time):
+                    journal.append(ride)
+
                 ride_list.add_ride(ride)
 
                 print_success("Added ride.")
-                _display_previous_rides(ride_list, ride.tracking_number)
+                _display_previous_rides(ride_list.get_rides_on_bus(ride.tracking_number), ride.tracking_number)
             except RideError as e:
                 _print_error_message(e)
+            except OSError:
+                print_error("Could not save ride to the journal.")
 
 def _prompter(prompt: str, validator):
     """
@@ -158,20 +204,39 @@ def _create_ride_from_tokens(tokens: list) -> Ride:
             notes=""
         )
 
-def _display_previous_rides(ride_list: RideList, tracking_number: str):
+def _display_previous_rides(prev_rides: list[Ride], tracking_number: str):
     """
-    Prints all rides in `ride_list` corresponding to `tracking_number` if there
-    are at least two such rides.
+    Prints all rides on the bus with a given tracking number if there are
+    at least two such rides.
 
-    :param ride_list: the ride list from which to print all rides on the bus
-    with the given tracking number.
+    :param prev_rides: all rides on the bus with the given tracking number,
+    including the one just added.
     :param tracking_number: the tracking number of the bus for which to
     print all rides.
     """
-    prev_rides: list[Ride] = ride_list.get_rides_on_bus(tracking_number)
-
     if len(prev_rides) > 1:
         print(f"\nYou have been on bus {tracking_number} {len(prev_rides)} times:")
 
         for curr in prev_rides:
             print_ride_compact(curr)
+
+def _display_location(location_future: Future | None) -> None:
+    """
+    Prints the latest known location of a bus once its background lookup
+    completes, or nothing if there was no lookup, the bus has never been
+    seen, or the lookup failed (feed error or unreadable sighting store).
+
+    :param location_future: the future holding the result of the location
+    lookup, or `None` if no lookup was made.
+    """
+    if location_future is None:
+        return
+
+    try:
+        sighting: Sighting | None = location_future.result()
+    except (FeedError, ValueError, OSError):
+        return
+
+    if sighting is not None:
+        print()
+        print_sighting(sighting)
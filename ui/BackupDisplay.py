@@ -0,0 +1,84 @@
+from domain.RideList import RideList
+from persistence.BackupRepository import BackupRepository
+from persistence.exceptions.BackupError import BackupError, RepositoryNotFoundError
+from utilities.PrintHelper import print_error, print_success
+
+def back_up_rides(rides_directory: str) -> None:
+    """
+    Prompts the user for a backup directory and writes an incremental
+    backup of the ride store into it.
+
+    :param rides_directory: the directory of the ride store to back up.
+    """
+    backup_directory: str = input("Enter the backup directory: ").strip()
+
+    try:
+        snapshot_id: str = BackupRepository(backup_directory).create_backup(rides_directory)
+        print_success(f"Created backup {snapshot_id}.")
+    except OSError:
+        print_error("Could not write to the backup directory.")
+
+def verify_backups() -> None:
+    """
+    Prompts the user for a backup directory and checks every backup in it,
+    printing any missing or corrupt chunks.
+    """
+    backup_directory: str = input("Enter the backup directory: ").strip()
+
+    try:
+        bad_chunks: list[str] = BackupRepository(backup_directory, create=False).verify()
+    except RepositoryNotFoundError:
+        print_error("There are no backups in this directory.")
+        return
+    except (BackupError, OSError):
+        print_error("Could not read the backup directory.")
+        return
+
+    if bad_chunks:
+        print_error(f"{len(bad_chunks)} chunks are missing or corrupt:")
+        for chunk_hash in bad_chunks:
+            print(chunk_hash)
+    else:
+        print_success("All backups are intact.")
+
+def restore_rides() -> RideList | None:
+    """
+    Prompts the user for a backup directory and one of its backups, and
+    rebuilds the ride list stored in that backup.
+
+    :return: the restored ride list, or `None` if nothing was restored.
+    """
+    backup_directory: str = input("Enter the backup directory: ").strip()
+
+    try:
+        repository = BackupRepository(backup_directory, create=False)
+        snapshot_ids: list[str] = repository.list_snapshots()
+    except RepositoryNotFoundError:
+        print_error("There are no backups in this directory.")
+        return None
+    except OSError:
+        print_error("Could not read the backup directory.")
+        return None
+
+    if not snapshot_ids:
+        print_error("There are no backups in this directory.")
+        return None
+
+    for i, snapshot_id in enumerate(snapshot_ids, start=1):
+        print(f"{i}. {snapshot_id}")
+
+    choice: str = input(f"Enter the number of the backup to restore (1-{len(snapshot_ids)}): ").strip()
+
+    if not choice.isdigit() or not 1 <= int(choice) <= len(snapshot_ids):
+        print_error("Invalid backup number.")
+        return None
+
+    try:
+        ride_list: RideList = repository.restore_ride_list(snapshot_ids[int(choice) - 1])
+    except (BackupError, OSError):
+        print_error("This backup is missing or corrupt.")
+        return None
+
+    print_success("Restored rides.")
+
+    return ride_list
@@ -0,0 +1,70 @@
+import os
+
+from domain.Ride import Ride
+from logic.RideMerger import ConflictPolicy, merge_ride_files
+from logic.exceptions.RideMergerError import RideMergerError, UnsortedSourceError
+from persistence.BackupRepository import BackupRepository, SNAPSHOTS_DIRECTORY
+from persistence.PartitionedRideStore import iter_sorted_rides
+from persistence.RideJournal import RideJournal
+from persistence.exceptions.BackupError import BackupError
+from ui.printing.RidePrinter import print_ride_compact
+from utilities.PrintHelper import print_error, print_success
+
+def merge_histories() -> None:
+    """
+    Prompts the user for several ride histories (ride files, ride store
+    directories or backup directories), a conflict policy and an output
+    file, and writes the merged history to the output file. Prints every
+    conflict found while merging.
+    """
+    print("Enter the ride histories to merge, oldest first, one per line (blank line to finish).")
+
+    paths: list[str] = []
+    while path := input("> ").strip():
+        if os.path.exists(path):
+            paths.append(path)
+        else:
+            print_error("No such file or directory.")
+
+    policies: str = ", ".join(curr.value for curr in ConflictPolicy)
+    output_path: str = input("Enter the output file: ").strip()
+
+    try:
+        policy: ConflictPolicy = ConflictPolicy.from_string(input(f"Enter the conflict policy ({policies}): "))
+        conflicts: list[list[Ride]] = merge_ride_files([_open_history(curr) for curr in paths], output_path, policy)
+    except UnsortedSourceError:
+        print_error("Ride files should be sorted by date and boarding time.")
+        return
+    except RideMergerError:
+        print_error(f"Conflict policy should be one of: {policies}.")
+        return
+    except (BackupError, OSError, ValueError):
+        print_error("Could not read or write one of the ride histories.")
+        return
+
+    for rides in conflicts:
+        print("\nConflict:")
+        for curr in rides:
+            print_ride_compact(curr)
+
+    print_success(f"Merged {len(paths)} histories into {output_path} ({len(conflicts)} conflicts).")
+
+def _open_history(path: str):
+    """
+    Opens a ride history as a stream of rides sorted by date and boarding
+    time, without writing anything into it. Backup directories are read
+    from their latest backup.
+
+    :param path: the path of a ride file, ride store directory, or backup
+    directory.
+    :return: an iterator over the rides in the history, earliest first.
+    """
+    if os.path.isdir(os.path.join(path, SNAPSHOTS_DIRECTORY)):
+        repository = BackupRepository(path, create=False)
+        snapshot_ids: list[str] = repository.list_snapshots()
+
+        return repository.iter_sorted_rides(snapshot_ids[-1]) if snapshot_ids else iter([])
+    elif os.path.isdir(path):
+        return iter_sorted_rides(path)
+
+    return RideJournal(path).iter_rides()
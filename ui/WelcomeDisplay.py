@@ -0,0 +1,29 @@
+from persistence.RideSummary import RideSummary
+from ui.printing.RidePrinter import print_ride_compact
+
+WELCOME_TITLE = "Bus Tracker"
+MOST_FREQUENT_VEHICLES_COUNT = 3
+
+def print_welcome_screen(summary: RideSummary) -> None:
+    """
+    Prints the welcome screen from a precomputed ride summary: the total
+    number of rides, the number of unique buses ridden, the most frequently
+    ridden buses, and the five most recent rides.
+
+    :param summary: the summary of the ride history to display.
+    """
+    print(f"{WELCOME_TITLE}\n{'=' * len(WELCOME_TITLE)}")
+
+    if summary.total_rides == 0:
+        print("No rides recorded yet.")
+        return
+
+    most_frequent: str = ", ".join(f"{tracking_number} ({count})" for tracking_number, count
+                                   in summary.get_most_frequent_vehicles(MOST_FREQUENT_VEHICLES_COUNT))
+
+    print(f"{summary.total_rides} rides on {summary.get_unique_vehicle_count()} unique buses.\n"
+          f"Most ridden buses: {most_frequent}\n"
+          f"\nMost recent rides:")
+
+    for curr in summary.recent_rides:
+        print_ride_compact(curr)
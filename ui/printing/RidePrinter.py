@@ -1,6 +1,7 @@
 import textwrap
 
 from domain.Ride import Ride
+from domain.Sighting import Sighting
 
 LINE_WIDTH = 72
 INDENT_SPACES = 3
@@ -64,4 +65,17 @@ def _print_paragraph(text: str, indentation: int) -> None:
         subsequent_indent= " " * indentation
     )
 
-    print(wrapper.fill(text))
\ No newline at end of file
+    print(wrapper.fill(text))
+
+def print_sighting(sighting: Sighting) -> None:
+    """
+    Prints the location of a bus at the time of a given sighting, along
+    with the route it was serving (if any).
+
+    :param sighting: the sighting to print.
+    """
+    time_str: str = sighting.seen_at.strftime("%Y-%m-%d %H:%M")
+    route_str: str = f"on route {sighting.route}" if sighting.route else "out of service"
+
+    print(f"Bus {sighting.tracking_number} was last seen {route_str} at "
+          f"({sighting.latitude:.5f}, {sighting.longitude:.5f}) on {time_str}.")
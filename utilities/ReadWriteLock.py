@@ -0,0 +1,62 @@
+import threading
+from contextlib import contextmanager
+
+class ReadWriteLock:
+    """
+    A lock allowing either any number of concurrent readers or a single writer. Waiting writers are given
+    priority over new readers so that a steady stream of reads cannot starve writes. The thread holding the
+    write lock may also acquire the read lock (or the write lock again) without deadlocking.
+    """
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._waiting_writers: int = 0
+        self._writer: int | None = None
+        self._writer_depth: int = 0
+
+    @contextmanager
+    def read_lock(self):
+        """
+        Holds the lock in shared (read) mode for the duration of a `with` block.
+        """
+        if self._writer == threading.get_ident():
+            yield
+            return
+
+        with self._condition:
+            while self._writer is not None or self._waiting_writers > 0:
+                self._condition.wait()
+            self._readers += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        """
+        Holds the lock in exclusive (write) mode for the duration of a `with` block.
+        """
+        ident: int = threading.get_ident()
+
+        with self._condition:
+            if self._writer != ident:
+                self._waiting_writers += 1
+                while self._writer is not None or self._readers > 0:
+                    self._condition.wait()
+                self._waiting_writers -= 1
+                self._writer = ident
+            self._writer_depth += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._condition.notify_all()